@@ -23,6 +23,129 @@ fire behavior models for practical wildfire management and prediction.
 """
 
 import time, math, datetime
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+# Moore neighbourhood offsets (dx, dy), one neighbour slot per offset
+NEIGHBOUR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+OFFSET_X = np.array([dx for dx, dy in NEIGHBOUR_OFFSETS])
+OFFSET_Y = np.array([dy for dx, dy in NEIGHBOUR_OFFSETS])
+
+# Angle between north (0, 1) and the spread direction (dx, dy) for every
+# neighbour offset, signed for east/west orientation: ANGLE_LUT[dx + 1, dy + 1]
+ANGLE_LUT = np.array([[(-1 if dx == 1 else 1) * math.acos(dy / math.hypot(dx, dy))
+                       if (dx, dy) != (0, 0) else 0.0
+                       for dy in (-1, 0, 1)] for dx in (-1, 0, 1)])
+
+# Ignition progress of unburned parcels is stored as signed fixed point,
+# this value standing for a complete ignition. Cold and humid parcels lose
+# progress (negative base spread rate), which then delays their ignition.
+IGNITION_THRESHOLD = 65535
+
+# Edge length of the square grid tiles the active parcels are grouped by
+TILE_SIZE = 64
+
+def _distance(lat_a, lon_a, lat_b, lon_b):
+    """
+    Calculate the distance between two nearby geographic points.
+    
+    Uses the equirectangular approximation: at the grid scale (cells of
+    about a kilometre) its error is a few centimetres, far below the
+    model precision, and it is much cheaper than the Haversine formula.
+    
+    Args:
+        lat_a, lon_a (float): First point coordinates in degrees
+        lat_b, lon_b (float): Second point coordinates in degrees
+        
+    Returns:
+        float: Distance in meters between the two points
+    """
+    R = 6373000.0  # Earth radius in meters
+    
+    # Convert coordinate differences to radians
+    lat_a = math.radians(lat_a)
+    lat_b = math.radians(lat_b)
+    dlon = math.radians(lon_b - lon_a)
+    dlat = lat_b - lat_a
+    
+    # Flat-earth projection around the mid latitude
+    dx = dlon * math.cos((lat_a + lat_b) / 2) * R
+    dy = dlat * R
+    
+    return math.hypot(dx, dy)
+
+@njit(cache=True, fastmath=True)
+def _compute_slope_influence(self_elevation, neighbour_elevation, distance):
+    """
+    Compute slope coefficients between parcels and their neighbours.
+    
+    Elevations and distances are fixed, so this is only evaluated once per
+    (parcel, neighbour) pair when the map is generated.
+    
+    Args:
+        self_elevation (ndarray): Elevation of the receiving parcels
+        neighbour_elevation (ndarray): Elevation of the spreading neighbours
+        distance (ndarray): Horizontal distances between the parcels in meters
+        
+    Returns:
+        ndarray: Slope influence coefficients t_theta
+    """
+    # Slope influence coefficient (uphill fire spreads faster)
+    return np.tan(1.2 * np.arctan((self_elevation - neighbour_elevation) / distance))
+
+@njit(cache=True, fastmath=True)
+def _compute_neighbour_influence(angle_to_north, wind_direction):
+    """
+    Compute wind coefficients of burning neighbours.
+    
+    All arguments are arrays with one entry per (parcel, burning neighbour)
+    pair, so the whole tick is handled by a single call.
+    
+    Args:
+        angle_to_north (ndarray): Fire spread directions from ANGLE_LUT in radians
+        wind_direction (ndarray): Wind direction at the neighbours in degrees
+        
+    Returns:
+        ndarray: Wind direction coefficients c_phi
+    """
+    # Wind direction coefficient (positive when fire spreads downwind)
+    return np.cos(np.radians(wind_direction - 180) - angle_to_north)
+
+def _parcel_field(name, doc):
+    """Expose one column of the Map arrays as a Parcel attribute."""
+    def getter(self):
+        return getattr(self.map, name)[self.index]
+
+    def setter(self, value):
+        getattr(self.map, name)[self.index] = value
+
+    return property(getter, setter, doc=doc)
+
+def _state_field(doc):
+    """Expose the fire state and ignition progress as one fractional value."""
+    def getter(self):
+        state = int(self.map.s[self.index])
+        if state == 0:
+            return self.map.ignite[self.index] / IGNITION_THRESHOLD
+        return state
+
+    def setter(self, value):
+        if value >= 1:
+            self.map.s[self.index] = int(value)
+            self.map.ignite[self.index] = IGNITION_THRESHOLD
+        else:
+            self.map.s[self.index] = 0
+            self.map.ignite[self.index] = round(value * IGNITION_THRESHOLD)
+
+    return property(getter, setter, doc=doc)
 
 class Parcel:
     """
@@ -31,95 +154,87 @@ class Parcel:
     Each parcel contains satellite-derived vegetation data, meteorological
     conditions, topographic information, and calculates fire spread rates
     using established wildfire research formulas.
+    
+    The data itself lives in the parallel arrays of the owning Map (one entry
+    per parcel, flat index x*H + y); a Parcel is a thin view onto one index.
     """
     
-    def __init__(self, position=[], parameters={}, scale=0):
+    # Terrain properties
+    water = _parcel_field('water', "Water body flag (prevents fire spread)")
+    combustible = _parcel_field('combustible', "Can catch fire (opposite of water/rock)")
+    explored = _parcel_field('explored', "Fire spread calculation flag")
+    fire = _parcel_field('fire_detected', "Fire detected by NASA FIRMS")
+    
+    # Environmental data from satellite/weather sources
+    elevation = _parcel_field('elevation', "Elevation in meters")
+    treecover = _parcel_field('treecover', "Tree coverage percentage")
+    temperature = _parcel_field('temperature', "Temperature in °C")
+    humidity = _parcel_field('humidity', "Relative humidity percentage")
+    wind_direction = _parcel_field('wind_direction', "Wind direction in degrees")
+    wind_speed = _parcel_field('wind_speed', "Wind speed in m/s")
+    
+    # Fire spread coefficients
+    w = _parcel_field('w', "Modified wind speed")
+    k_s = _parcel_field('k_s', "Vegetation fuel factor")
+    r_0 = _parcel_field('r_0', "Base fire spread rate")
+    r = _parcel_field('r', "Fire spread rate without wind and slope effects")
+    
+    # Fire state: 0=unburned, 1=igniting, 2=burning, 3=cooling, 4=burned
+    s = _state_field("Fire state, ignition progress in [0, 1) while unburned")
+    
+    # Parcel views only hold these attributes, without a per-instance __dict__
+    __slots__ = ('map', 'index', 'x', 'y')
+    
+    def __init__(self, terrain, x, y):
         """
-        Initialize a terrain parcel with real-world environmental data.
+        Initialize a view onto one parcel of the terrain map.
         
         Args:
-            position (list): Grid coordinates [x, y] in the simulation
-            parameters (dict): Environmental data from Google Earth Engine
-            scale (float): Real-world size of each grid cell in meters
+            terrain (Map): Map holding the parcel data arrays
+            x, y (int): Grid coordinates of the parcel in the simulation
         """
-        self.parameters = parameters
-        self.location = {
-            'latitude': parameters['latitude'], 
-            'longitude': parameters['longitude']
-        }
-        self.position = position      # Grid coordinates (x, y)
-        self.neighbours = []          # Connected adjacent parcels
-        self.explored = False         # Fire spread calculation flag
-        self.fire = parameters['fire'] if 'fire' in parameters else None
-        
-        # Terrain properties
-        self.water = False           # Water body flag (prevents fire spread)
-        self.combustible = True      # Can catch fire (opposite of water/rock)
-        
-        # Environmental data from satellite/weather sources
-        self.elevation = parameters['elevation'] if 'elevation' in parameters else None
-        self.treecover = parameters['treecover']    # Tree coverage percentage
-        self.temperature = parameters['temp']       # Temperature in °C
-        self.humidity = parameters['humidity']      # Relative humidity percentage
-        self.wind_direction = parameters['winddir'] # Wind direction in degrees
-        self.wind_speed = parameters['windspeed']   # Wind speed in m/s
-        
-        # Simulation parameters
-        self.scale = scale           # Real-world cell size in meters
-        self.m = 0.005              # Precision factor for calculations
-        
-        # Fire spread coefficients (calculated dynamically)
-        self.c_phi = 0              # Wind direction coefficient
-        self.t_theta = 0            # Slope influence coefficient
-        self.r_max = 1              # Maximum fire spread rate (m/min)
-        
-        # Fire state and timing
-        self.s = 0                  # Fire state: 0=unburned, 1=igniting, 2=burning, 3=cooling, 4=burned
-        self.dt = self.m * self.scale / self.r_max  # Time step in minutes
-        
-        self.calcul_coefs()
+        self.map = terrain
+        self.x = x                                  # Grid coordinates, kept as plain ints
+        self.y = y
+        self.index = x * terrain.dimensions[1] + y  # Flat index in the Map arrays
 
-    def calcul_coefs(self):
-        """
-        Calculate fire spread coefficients based on environmental conditions.
-        
-        Uses established wildfire research formulas to compute:
-        - Wind effects on fire spread (exponential relationship)
-        - Slope acceleration factors
-        - Vegetation fuel load influence
-        - Base fire spread rate considering temperature and humidity
-        
-        Formula sources: Rothermel fire spread model and derivatives
-        """
-        # Empirical constants from wildfire research
-        a, b, c, d = 0.03, 0.05, 0.01, 0.3
-        
-        # Wind factor calculation (modified wind speed)
-        self.w = (self.wind_speed / 0.836) ** (2/3)
-        
-        # Wind direction effect (exponential influence)
-        self.k_phi = math.exp(0.1783 * self.wind_speed * self.c_phi)
-        
-        # Slope effect (exponential slope acceleration)
-        self.k_theta = math.exp(3.553 * self.t_theta)
-        
-        # Vegetation fuel factor (cubic relationship with tree coverage)
-        self.k_s = ((self.treecover + 30) / 100) ** 3
-        
-        # Base fire spread rate incorporating weather conditions
-        self.r_0 = (a * self.temperature + 
-                   b * self.w + 
-                   c * (100 - self.humidity) - d)
-        
-        # Final fire spread rate combining all factors
-        self.r = self.r_0 * self.k_phi * self.k_theta * self.k_s ** 2 * 0.13
+    @property
+    def position(self):
+        """Grid coordinates (x, y) of the parcel."""
+        return (self.x, self.y)
+
+    @property
+    def lat(self):
+        """Latitude of the parcel in degrees."""
+        return self.map.latitude[self.index]
+
+    @property
+    def lon(self):
+        """Longitude of the parcel in degrees."""
+        return self.map.longitude[self.index]
+
+    @property
+    def neighbours(self):
+        """Connected adjacent parcels."""
+        height = self.map.dimensions[1]
+        return [self.map.parcel(*divmod(int(j), height)) for j in self.map.neigh[self.index] if j >= 0]
+
+    @property
+    def scale(self):
+        """Real-world cell size in meters."""
+        return self.map.scale
+
+    @property
+    def dt(self):
+        """Time step in minutes."""
+        return self.map.dt
 
     def __repr__(self):
         """Detailed string representation of parcel environmental data."""
         return f"""
         ----
-        latitude : {self.location['latitude']}, 
-        longitude : {self.location['longitude']}, 
+        latitude : {self.lat}, 
+        longitude : {self.lon}, 
         elevation : {self.elevation},
         temp : {self.temperature},
         treecover : {self.treecover},
@@ -127,137 +242,111 @@ class Parcel:
         ----
         """
 
-    def add_neighbour(self, parcel):
+class Map:
+    """
+    Complete terrain representation using real-world satellite and weather data.
+    
+    Integrates with Google Earth Engine database to create accurate environmental
+    conditions for each terrain parcel in the simulation area.
+    """
+    
+    def __init__(self, parent):
         """
-        Add bidirectional connection to an adjacent parcel.
+        Initialize the real-world terrain map.
         
         Args:
-            parcel (Parcel): Adjacent terrain cell to connect
+            parent: Reference to main application with database connection
         """
-        if parcel not in self.neighbours:
-            self.neighbours.append(parcel)
+        self.parent = parent
+        self.database = parent.database  # Google Earth Engine interface
 
-    def distance(self, A, B):
+    def _recalc_coefs(self, idx=slice(None)):
         """
-        Calculate great circle distance between two geographic points.
+        Calculate the static fire spread coefficients of the selected parcels.
         
-        Uses the Haversine formula for accurate distance calculation
-        on the Earth's curved surface.
+        Computes the wind factor, vegetation fuel factor and base spread rate,
+        which only depend on the environmental data, and the spread rate r of
+        a parcel without wind direction or slope effect.
         
         Args:
-            A (dict): First location with 'latitude' and 'longitude' keys
-            B (dict): Second location with 'latitude' and 'longitude' keys
-            
-        Returns:
-            float: Distance in meters between the two points
+            idx: Flat indices (or mask/slice) of the parcels to update
         """
-        R = 6373.0  # Earth radius in kilometers
+        # Empirical constants from wildfire research
+        a, b, c, d = 0.03, 0.05, 0.01, 0.3
+        
+        # The float16 environmental fields are promoted to float32 for the computation
+        wind_speed = self.wind_speed[idx].astype(np.float32)
+        treecover = self.treecover[idx].astype(np.float32)
+        temperature = self.temperature[idx].astype(np.float32)
+        humidity = self.humidity[idx].astype(np.float32)
         
-        # Convert coordinates to radians
-        lat_a = math.radians(A['latitude'])
-        long_a = math.radians(A['longitude'])
-        lat_b = math.radians(B['latitude'])
-        long_b = math.radians(B['longitude'])
+        # Wind factor calculation (modified wind speed)
+        self.w[idx] = np.power(wind_speed / 0.836, 2/3)
         
-        # Calculate coordinate differences
-        dlon = long_b - long_a
-        dlat = lat_b - lat_a
+        # Vegetation fuel factor (cubic relationship with tree coverage),
+        # multiplied out instead of the generic power function
+        fuel = (treecover + 30) / 100
+        k_s = fuel * fuel * fuel
+        self.k_s[idx] = k_s
         
-        # Haversine formula for great circle distance
-        a = (math.sin(dlat / 2)**2 + 
-             math.cos(lat_a) * math.cos(lat_b) * math.sin(dlon / 2)**2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        # Base fire spread rate incorporating weather conditions
+        self.r_0[idx] = (a * temperature + 
+                         b * self.w[idx] + 
+                         c * (100 - humidity) - d)
         
-        return R * c * 1000  # Convert to meters
+        # Spread rate without wind direction or slope effect: the base rate
+        # the directional factors of _spread_rate are applied to
+        self.r[idx] = self.r_0[idx] * (k_s * k_s) * 0.13
 
-    def fire_calcul(self):
+    def _spread_rate(self, idx, c_phi, t_theta):
         """
-        Calculate fire state progression based on neighboring fire conditions.
+        Calculate the fire spread rate of parcels for given wind and slope coefficients.
         
-        Implements a multi-state fire model:
-        - State 0: Unburned, susceptible
-        - State 1: Ignition threshold reached
-        - State 2: Actively burning
-        - State 3: Fire cooling down
-        - State 4: Completely burned out
+        Uses established wildfire research formulas combining:
+        - Wind effects on fire spread (exponential relationship)
+        - Slope acceleration factors
+        - Vegetation fuel load influence
+        - Base fire spread rate considering temperature and humidity
         
-        Incorporates slope and wind effects for each burning neighbor.
-        """
-        if self.s == 0 and not self.explored:
-            # Mark as explored but not yet ignited
-            self.explored = True
-
-        elif self.explored:
-            north_vector = (0, 1)  # Reference vector pointing north
-            
-            # Calculate slope and wind effects from burning neighbors
-            for neighbour in self.neighbours:
-                if neighbour.s >= 2:  # If neighbor is actively burning
-                    
-                    # Calculate slope effect on fire spread
-                    elevation_difference = self.elevation - neighbour.elevation
-                    horizontal_distance = abs(self.distance(neighbour.location, self.location))
-                    
-                    # Slope influence coefficient (uphill fire spreads faster)
-                    neighbour.t_theta = math.tan(1.2 * math.atan(elevation_difference / horizontal_distance))
-                    
-                    # Calculate wind direction effect
-                    direction_vector = (self.position[0] - neighbour.position[0], 
-                                      self.position[1] - neighbour.position[1])
-                    vector_magnitude = (direction_vector[0]**2 + direction_vector[1]**2)**0.5
-                    angle_to_north = math.acos((north_vector[0] * direction_vector[0] + 
-                                              north_vector[1] * direction_vector[1]) / vector_magnitude)
-                    
-                    # Adjust angle sign for east/west orientation
-                    if direction_vector[0] == 1:
-                        angle_to_north = -angle_to_north
-                    
-                    # Wind direction coefficient (positive when fire spreads downwind)
-                    neighbour.c_phi = math.cos(math.radians(neighbour.wind_direction - 180) - angle_to_north)
-                    
-                    # Recalculate fire spread coefficients with new slope/wind data
-                    neighbour.calcul_coefs()
-
-            # Get fire spread rates from all neighbors
-            neighbours_r = [neighbour.r for neighbour in self.neighbours]
+        Formula sources: Rothermel fire spread model and derivatives
+        
+        Args:
+            idx: Flat indices of the spreading parcels
+            c_phi: Wind direction coefficients (one per index, or scalar)
+            t_theta: Slope influence coefficients (one per index, or scalar)
             
-            # State transition logic
-            if self.s == 1:
-                # Transition from ignition to active burning
-                self.s = 2
-            elif self.s == 2:
-                # Check if fire should start cooling (no more fuel around)
-                if all([True if not neighbour.combustible or neighbour.s >= 2 
-                       else False for neighbour in self.neighbours]):
-                    self.s = 3
-            elif self.s == 3:
-                # Transition from cooling to burned out
-                self.s = 4
-            else:
-                # Calculate fire accumulation from burning neighbors
-                if self.s < 1:
-                    fire_accumulation = (sum(neighbours_r) * self.dt) / self.scale
-                    new_fire_state = self.s + fire_accumulation
-                    # Cap at ignition threshold
-                    self.s = new_fire_state if new_fire_state < 1 else 1
+        Returns:
+            ndarray: Fire spread rates in m/min
+        """
+        # Wind direction and slope effects (exponential influence and
+        # acceleration) fused into a single exponential of the base rate
+        return self.r[idx] * np.exp(0.1783 * self.wind_speed[idx].astype(np.float32) * c_phi +
+                                    3.553 * t_theta)
 
-class Map:
-    """
-    Complete terrain representation using real-world satellite and weather data.
-    
-    Integrates with Google Earth Engine database to create accurate environmental
-    conditions for each terrain parcel in the simulation area.
-    """
-    
-    def __init__(self, parent):
+    def _recalc_spread_table(self):
         """
-        Initialize the real-world terrain map.
-        
-        Args:
-            parent: Reference to main application with database connection
+        Calculate the ignition progress every parcel gives each of its neighbours.
+        
+        The wind and slope coefficients only depend on the fixed environmental
+        data and on the neighbour offset, and the time step and cell size are
+        fixed for the map. Both are folded into two tables of per-tick
+        increments in IGNITION_THRESHOLD units, so a simulation tick only
+        has to pick and sum table entries:
+        - base_increment[i, k]: from neigh[i, k] to parcel i while not burning
+        - burning_increment[i, k]: from neigh[i, k] to parcel i while burning
+        Missing neighbours give nothing in both tables.
         """
-        self.parent = parent
-        self.database = parent.database  # Google Earth Engine interface
+        rows, slots = np.nonzero(self.neigh_mask)
+        spreading = self.neigh[rows, slots]
+        c_phi = _compute_neighbour_influence(ANGLE_LUT[1 - OFFSET_X[slots], 1 - OFFSET_Y[slots]],
+                                             self.wind_direction[spreading])
+        factor = self.dt / self.scale * IGNITION_THRESHOLD
+        
+        self.base_increment = np.zeros(self.neigh.shape, dtype=np.float32)
+        self.base_increment[rows, slots] = self.r[spreading] * factor
+        self.burning_increment = np.zeros(self.neigh.shape, dtype=np.float32)
+        self.burning_increment[rows, slots] = self._spread_rate(
+            spreading, c_phi, self.t_theta_table[rows, slots]) * factor
 
     def generate_map(self, map_parameters):
         """
@@ -281,37 +370,213 @@ class Map:
         t = time.time()
         print('Loading real-world environmental data...')
         
-        self.map = []
+        # Parcel data arrays, one entry per parcel at flat index x*H + y
+        n = dimensions[0] * dimensions[1]
+        self.dimensions = dimensions
+        self.scale = scale                   # Real-world cell size in meters
+        self.m = 0.005                       # Precision factor for calculations
+        self.r_max = 1                       # Maximum fire spread rate (m/min)
+        self.dt = self.m * self.scale / self.r_max  # Time step in minutes
         
-        # Generate grid with real environmental data for each cell
-        for x in range(dimensions[0]):
-            row = []
-            for y in range(dimensions[1]):
-                # Calculate real-world coordinates for this grid cell
-                lat = round(boundaries['north'] - y * delta_scale['latitude'], 6)
-                long = round(boundaries['west'] + x * delta_scale['longitude'], 6)
-                
-                # Fetch environmental data from Google Earth Engine
-                environmental_data = self.database.land_data({'latitude': lat, 'longitude': long})
-                
-                # Create parcel with real-world data
-                row.append(Parcel(position=(x, y), parameters=environmental_data, scale=scale))
-            self.map.append(row)
-        
-        # Establish 8-directional connectivity between parcels
-        for x in range(dimensions[0]):
-            for y in range(dimensions[1]):
-                parcel = self.map[x][y]
-                # Connect to all adjacent cells
-                for i in range(x-1, x+2):
-                    for j in range(y-1, y+2):
-                        if (0 <= i < dimensions[0] and 0 <= j < dimensions[1] and 
-                            (x, y) != (i, j)):
-                            parcel.add_neighbour(self.map[i][j])
+        for name in ('latitude', 'longitude', 'elevation', 'wind_direction'):
+            setattr(self, name, np.zeros(n))
+        
+        # Low precision fields: percentages and weather readings in float16,
+        # derived coefficients in float32
+        for name in ('treecover', 'temperature', 'humidity', 'wind_speed'):
+            setattr(self, name, np.zeros(n, dtype=np.float16))
+        for name in ('w', 'k_s', 'r_0', 'r'):
+            setattr(self, name, np.zeros(n, dtype=np.float32))
+        
+        # Fire state (0-4) and signed ignition progress of unburned parcels
+        self.s = np.zeros(n, dtype=np.uint8)
+        self.ignite = np.zeros(n, dtype=np.int32)
+        self.fire_detected = np.zeros(n, dtype=bool) # Fire detected by NASA FIRMS
+        self.water = np.zeros(n, dtype=bool)         # Water body flag
+        self.combustible = np.ones(n, dtype=bool)    # Can catch fire
+        self.explored = np.zeros(n, dtype=bool)      # Fire spread calculation flag
+        
+        # Real-world coordinates of every grid cell, in flat index order
+        x, y = np.meshgrid(np.arange(dimensions[0]), np.arange(dimensions[1]), indexing='ij')
+        latitudes = boundaries['north'] - y.ravel() * delta_scale['latitude']
+        longitudes = boundaries['west'] + x.ravel() * delta_scale['longitude']
+        
+        # Fetch environmental data from Google Earth Engine for all cells at once
+        environmental_data = self.database.land_data_bulk(
+            [{'latitude': round(float(lat), 6), 'longitude': round(float(long), 6)}
+             for lat, long in zip(latitudes, longitudes)])
+        
+        # Store real-world data in the parcel arrays
+        for i, data in enumerate(environmental_data):
+            self.latitude[i] = data['latitude']
+            self.longitude[i] = data['longitude']
+            elevation = data.get('elevation')
+            self.elevation[i] = elevation if elevation is not None else np.nan
+            self.treecover[i] = data['treecover']
+            self.temperature[i] = data['temp']
+            self.humidity[i] = data['humidity']
+            self.wind_direction[i] = data['winddir']
+            self.wind_speed[i] = data['windspeed']
+            self.fire_detected[i] = bool(data.get('fire'))
+        
+        # Initial fire spread coefficients for every parcel
+        self._recalc_coefs()
+        
+        # Establish 8-directional connectivity between parcels: neigh[i, k] is
+        # the flat index of the neighbour of parcel i at NEIGHBOUR_OFFSETS[k],
+        # or -1 outside the grid
+        ix, iy = np.meshgrid(np.arange(dimensions[0]), np.arange(dimensions[1]), indexing='ij')
+        jx = ix.reshape(-1, 1) + OFFSET_X
+        jy = iy.reshape(-1, 1) + OFFSET_Y
+        self.neigh_mask = (0 <= jx) & (jx < dimensions[0]) & (0 <= jy) & (jy < dimensions[1])
+        self.neigh = np.where(self.neigh_mask, jx * dimensions[1] + jy, -1).astype(np.int32)
+        
+        # Tile-major traversal order: parcels of a TILE_SIZE x TILE_SIZE tile
+        # are processed together so their neighbour gathers stay in cache.
+        # tile_order[r] is the parcel visited r-th, tile_rank its inverse
+        x, y = np.divmod(np.arange(n), dimensions[1])
+        tiles_y = -(-dimensions[1] // TILE_SIZE)
+        tile = (x // TILE_SIZE) * tiles_y + y // TILE_SIZE
+        self.tile_order = np.lexsort((np.arange(n), tile)).astype(np.int32)
+        self.tile_rank = np.empty(n, dtype=np.int32)
+        self.tile_rank[self.tile_order] = np.arange(n, dtype=np.int32)
+        
+        # Coordinates are fixed, so neighbour distances are computed once here.
+        # On the lat/long raster they only depend on the row (latitude) and on
+        # the neighbour offset: neighbour_distance[y, dx + 1, dy + 1]
+        self.neighbour_distance = np.zeros((dimensions[1], 3, 3), dtype=np.float32)
+        for y in range(dimensions[1]):
+            lat, lon = self.latitude[y], self.longitude[y]
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    if 0 <= y + dy < dimensions[1]:
+                        self.neighbour_distance[y, dx + 1, dy + 1] = _distance(
+                            lat, lon, self.latitude[y + dy], lon + dx * delta_scale['longitude'])
+        
+        # Slope coefficients are topology constant as well:
+        # t_theta_table[i, k] for fire spreading from neigh[i, k] to parcel i
+        y = np.arange(n) % dimensions[1]
+        distance = self.neighbour_distance[y[:, None], 1 + OFFSET_X, 1 + OFFSET_Y]
+        distance[~self.neigh_mask] = 1     # Missing neighbours, masked out below
+        neighbour_elevation = self.elevation[np.where(self.neigh_mask, self.neigh, 0)]
+        self.t_theta_table = np.where(
+            self.neigh_mask,
+            _compute_slope_influence(self.elevation[:, None], neighbour_elevation, distance),
+            0).astype(np.float32)
+        
+        # Spread rates towards each neighbour are static too
+        self._recalc_spread_table()
+        
+        # Fire states currently displayed by the parent screen
+        self.rendered_s = self.s.copy()
+        
+        # Double-buffered active parcel indices, allocated once and reused
+        # by every simulation tick
+        self.active_a = np.empty(n, dtype=np.int32)
+        self.active_b = np.empty(n, dtype=np.int32)
         
         print(f'Environmental data loading time: {time.time() - t}s')
 
-    def fire(self, position):
+    def parcel(self, x, y):
+        """
+        Get the parcel at given grid coordinates.
+        
+        Parcels are thin views created on demand, the parcel data itself
+        only lives in the Map arrays.
+        
+        Args:
+            x, y (int): Grid coordinates of the parcel
+            
+        Returns:
+            Parcel: View onto the parcel data
+        """
+        return Parcel(self, x, y)
+
+    def _ignition_increment(self, receiving):
+        """
+        Calculate the ignition progress gained by unburned parcels in one tick.
+        
+        Fire accumulates from all neighbours, burning ones spreading with
+        their slope and wind effects towards the parcel.
+        
+        Args:
+            receiving (ndarray): Flat indices of the unburned parcels
+            
+        Returns:
+            ndarray: Ignition progress increments in IGNITION_THRESHOLD units
+        """
+        burning = self.neigh_mask[receiving] & (self.s[self.neigh[receiving]] >= 2)
+        increments = np.where(burning, self.burning_increment[receiving],
+                              self.base_increment[receiving])
+        return np.rint(increments.sum(axis=1)).astype(np.int32)
+
+    def spread_step(self, active):
+        """
+        Calculate fire state progression of the active parcels for one tick.
+        
+        Implements a multi-state fire model:
+        - State 0: Unburned, susceptible
+        - State 1: Ignition threshold reached
+        - State 2: Actively burning
+        - State 3: Fire cooling down
+        - State 4: Completely burned out
+        
+        Incorporates slope and wind effects for each burning neighbor. All
+        parcels are updated at once from the states of the previous tick
+        using NumPy masks instead of one fire_calcul call per parcel.
+        
+        Args:
+            active (ndarray): Flat indices of the parcels to update
+            
+        Returns:
+            ndarray: Flat indices of the parcels active on the next tick, in tile order
+        """
+        s, neigh, neigh_mask = self.s, self.neigh, self.neigh_mask
+        
+        # Parcels seen for the first time are only marked as explored
+        explored = self.explored[active]
+        first = active[~explored & (s[active] == 0)]
+        processed = active[explored]
+        state = s[processed]
+        new_state = state.copy()
+        
+        # Transition from ignition to active burning
+        new_state[state == 1] = 2
+        
+        # Start cooling once no fuel is left around (all neighbours burning or not combustible)
+        burning = state == 2
+        neighbours = neigh[processed[burning]]
+        burnt_out = (~neigh_mask[processed[burning]] | ~self.combustible[neighbours] |
+                     (s[neighbours] >= 2))
+        new_state[np.flatnonzero(burning)[burnt_out.all(axis=1)]] = 3
+        
+        # Transition from cooling to burned out
+        new_state[state == 3] = 4
+        
+        # Accumulate ignition progress, igniting once the threshold is reached
+        accumulating = state == 0
+        receiving = processed[accumulating]
+        ignite = np.minimum(self.ignite[receiving] + self._ignition_increment(receiving),
+                            IGNITION_THRESHOLD)
+        self.ignite[receiving] = ignite
+        new_state[np.flatnonzero(accumulating)[ignite >= IGNITION_THRESHOLD]] = 1
+        
+        s[processed] = new_state
+        self.explored[first] = True
+        
+        # Burning parcels keep themselves and their unburned combustible
+        # neighbours active, cooling parcels only keep themselves active for
+        # their last transition. Burned out parcels are never requeued.
+        state = s[active]
+        burning = active[state == 2]
+        neighbours = neigh[burning][neigh_mask[burning]]
+        neighbours = neighbours[self.combustible[neighbours] & (s[neighbours] < 2)]
+        queued = np.concatenate((neighbours, burning, active[state == 3]))
+        
+        # Deduplicate in tile-major order for the next tick's gathers
+        return self.tile_order[np.unique(self.tile_rank[queued])]
+
+    def fire(self, position, max_iterations=1800):
         """
         Execute realistic fire propagation simulation with real environmental data.
         
@@ -320,72 +585,94 @@ class Map:
         
         Args:
             position (tuple): Ignition coordinates (x, y) in the grid
+            max_iterations (int): Iteration limit (1800 = 30 hours default)
             
         Returns:
             int: Total number of simulation iterations executed
         """
-        def spread_iteration(active_queue, max_iterations=1800):
+        def spread_iteration(active_count, max_iterations):
             """
             Execute iterative fire spread with real-world time progression.
             
+            The active parcels of the current tick are read from one index
+            buffer while the next tick's parcels are written to the other;
+            the buffers are swapped at the end of every tick.
+            
             Args:
-                active_queue (list): Parcels currently burning or at risk
+                active_count (int): Number of active parcels in self.active_a
                 max_iterations (int): Iteration limit (1800 = 30 hours default)
                 
             Returns:
                 int: Number of iterations completed
             """
             iteration_count = 0
-            dt = active_queue[0].dt  # Time step in minutes
+            dt = self.dt  # Time step in minutes
+            active, next_active = self.active_a, self.active_b
             
-            while ((active_queue != [] and max_iterations <= 0) or 
-                   (active_queue != [] and iteration_count < max_iterations and max_iterations > 0)):
-                
-                next_active_queue = []
+            # Repaint at most ~600 times per run instead of on every tick
+            render_stride = max(1, max_iterations // 600)
+            
+            while ((active_count > 0 and max_iterations <= 0) or 
+                   (active_count > 0 and iteration_count < max_iterations and max_iterations > 0)):
                 
                 # Process all currently active parcels
-                for parcel in active_queue:
-                    parcel.fire_calcul()
-                    
-                    if parcel.s == 2:  # Actively burning
-                        # Add combustible neighbors to next iteration
-                        for neighbour in parcel.neighbours:
-                            if (neighbour not in next_active_queue and 
-                                neighbour.combustible):
-                                next_active_queue.append(neighbour)
-                        
-                        # Keep burning parcel active
-                        if parcel not in next_active_queue:
-                            next_active_queue.append(parcel)
-                            
-                    elif parcel.s == 3:  # Cooling down
-                        # Keep cooling parcel active
-                        if parcel not in next_active_queue:
-                            next_active_queue.append(parcel)
-
-                # Update active parcels for next iteration
-                active_queue = next_active_queue.copy()
+                queued = self.spread_step(active[:active_count])
                 
-                # Update visualization
-                self.parent.update_map()
-                self.parent.window.flip()
+                # Swap buffers: queued parcels become the active ones
+                next_active[:len(queued)] = queued
+                active, next_active = next_active, active
+                active_count = len(queued)
                 
                 # Advance simulation time by real minutes
                 self.parent.actual_time += datetime.timedelta(minutes=dt)
                 
                 iteration_count += 1
-                time.sleep(10**-3)  # Small delay for smooth visualization
+                
+                # Update visualization
+                if iteration_count % render_stride == 0:
+                    self._render()
+            
+            # Show the final state when the last tick was not drawn
+            if iteration_count % render_stride != 0:
+                self._render()
                 
             return iteration_count
 
         # Initialize fire at specified origin point
+        initial_queue = self._ignite(position)
+        self.active_a[:len(initial_queue)] = initial_queue
+        
+        # Execute realistic fire propagation simulation
+        return spread_iteration(len(initial_queue), max_iterations)
+
+    def _render(self):
+        """
+        Send the parcels whose fire state changed since the last frame.
+        
+        The changed parcel positions are pushed to the parent screen as one
+        frame, which it redraws and presents incrementally.
+        """
+        changed = np.flatnonzero(self.s != self.rendered_s)
+        self.rendered_s[changed] = self.s[changed]
+        x, y = np.divmod(changed, self.dimensions[1])
+        self.parent.push_frame(list(zip(x.tolist(), y.tolist())))
+
+    def _ignite(self, position):
+        """
+        Set the fire origin burning.
+        
+        Args:
+            position (tuple): Ignition coordinates (x, y) in the grid
+            
+        Returns:
+            ndarray: Flat indices of the parcels active on the first tick
+        """
         x, y = position
-        origin_parcel = self.map[x][y]
+        origin_parcel = self.parcel(x, y)
         origin_parcel.explored = True
         origin_parcel.s = 2  # Set to actively burning
         
         # Start with origin and its neighbors
-        initial_queue = origin_parcel.neighbours + [origin_parcel]
-        
-        # Execute realistic fire propagation simulation
-        return spread_iteration(initial_queue)
\ No newline at end of file
+        initial_queue = [neighbour.index for neighbour in origin_parcel.neighbours]
+        initial_queue.append(origin_parcel.index)
+        return self.tile_order[np.sort(self.tile_rank[initial_queue])]
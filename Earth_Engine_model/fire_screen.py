@@ -24,10 +24,14 @@ wildfire behavior modeling and prediction validation.
 """
 
 import pygame as py
+import numpy as np
 import fire, land_data
-import time, sys, math
+import time, sys, math, os, hashlib, queue, threading
 from datetime import datetime
 
+# Event posted by the simulation thread when a frame is ready to be drawn
+FRAME_EVENT = py.event.custom_type()
+
 class Screen:
     """
     Main visualization interface for real-world forest fire simulation.
@@ -59,10 +63,12 @@ class Screen:
         # Display configuration
         self.screen_dimensions = (600, 600)  # Window size in pixels
         self.map_dimensions = (15, 15)      # Grid resolution (15x15 cells)
+        self.cell_w, self.cell_h = [self.screen_dimensions[i] // self.map_dimensions[i] for i in range(2)]  # Cell size in pixels
         
         # Simulation parameters
         self.fire_origin = (3, 5)           # Default ignition point
         self.date = datetime(2021, 8, 16, 17)  # Simulation start date/time
+        self.prefetch_imagery = False       # Download neighbouring regions' imagery in the background
         
         # Geographic boundaries (French Riviera region)
         self.boundaries = {
@@ -72,12 +78,9 @@ class Screen:
             'west': 6.251565      # Western longitude boundary
         }
         
-        # Create region polygon for Earth Engine queries
-        a = self.boundaries['east'], self.boundaries['north']
-        b = self.boundaries['west'], self.boundaries['north']
-        c = self.boundaries['west'], self.boundaries['south']
-        d = self.boundaries['east'], self.boundaries['south']
-        self.region = [a, b, c, d, a]  # Closed polygon
+        # Region bounds for Earth Engine queries
+        self.bounds = (self.boundaries['west'], self.boundaries['south'],
+                       self.boundaries['east'], self.boundaries['north'])
         
         # Calculate real-world scale parameters
         self.actual_time = self.date
@@ -89,6 +92,19 @@ class Screen:
         
         # Visualization state
         self.fire_visibility = False  # Toggle for fire detection overlay
+        self.overlay_keys = np.full(self.map_dimensions, -1)  # Cell state drawn at each overlay position
+        self.static_background = None  # Screen background without overlay
+        self.dirty_cells = set()       # Cells to redraw on the next incremental update
+        self.dirty_rects = []          # Screen areas to present, empty for the whole screen
+        self.text_rect = py.Rect(0, 0, 0, 0)  # Area of the simulation time text
+        self.font = py.font.SysFont('Arial', 40, bold=True)  # Simulation time font
+        self.time_text = None          # Last rendered simulation time
+        self.time_surface = None       # Pre-rendered simulation time text
+        
+        # Simulation thread state
+        self.frames = queue.Queue()    # Cells changed per frame, None once the simulation ends
+        self.lock = threading.Lock()   # Guards modification_possible
+        self.simulation = None         # Running fire simulation thread
         
         # Compile map parameters for data loading
         self.map_parameters = {
@@ -97,26 +113,67 @@ class Screen:
             'delta_scale': self.delta_scale,
             'date': self.date,
             'screen_dimensions': self.screen_dimensions,
-            'boundaries': self.boundaries,
-            'region': self.region
+            'boundaries': self.boundaries
         }
         
         # Initialize display and data systems
         self.screen = self.window.set_mode(self.screen_dimensions)
+        self.cell_keys, self.cell_tiles = self.build_cell_tiles()  # Prebuilt cell overlay pixels
+        self.cell_index = {key: i for i, key in enumerate(self.cell_keys)}
+        self.state_keys = np.array([self.cell_index[key] for key in ('empty', 's1', 's2', 's3', 's4')])
+        self.overlay_surface = py.Surface(self.screen_dimensions, py.SRCALPHA).convert_alpha()  # Grid overlay
         self.database = land_data.Database(
             self.map_parameters['date'],
             self.map_parameters['screen_dimensions'],
-            self.map_parameters['scale']
+            self.map_parameters['scale'],
+            prefetch=self.prefetch_imagery
         )
         
         self.load_map()
 
+    def build_cell_tiles(self):
+        """
+        Prebuild the bordered, transparent overlay pixels of each cell state.
+        
+        Each grid cell is drawn with one of a few fixed colors, so the
+        overlay pixels are created once and only copied when redrawing the map.
+        
+        Returns:
+            tuple: Cell display state names, and their RGBA pixels as an
+                array of shape (states, cell width, cell height, 4)
+        """
+        width, height = self.cell_w, self.cell_h
+        colors = {
+            'empty': (0, 0, 0, 0),                 # No overlay, border only
+            'water': (0, 0, 255, 150),             # Blue with transparency
+            'origin': (255, 255, 255, 200),        # White marker
+            's1': (255, 150, 0, 70),               # Light orange
+            's2': (255, 0, 0, 150),                # Red
+            's3': (255, 0, 0, 190),                # Dark red
+            's4': (0, 0, 0, 125),                  # Semi-transparent black
+            'valid_correct': (0, 200, 0, 200),     # Green
+            'valid_missed': (200, 0, 0, 100),      # Red
+            'valid_false': (100, 100, 0, 200)      # Yellow
+        }
+        
+        tiles = []
+        for color in colors.values():
+            surf = py.Surface((width, height), py.SRCALPHA).convert_alpha()  # Transparent overlay
+            surf.fill(color)
+            py.draw.rect(surf, (0, 0, 0, 100), surf.get_rect(), 1)  # Cell border
+            
+            # Keep the pixels as they appear once blended into the empty overlay
+            tile = py.Surface((width, height), py.SRCALPHA).convert_alpha()
+            tile.blit(surf, (0, 0))
+            tiles.append(np.dstack((py.surfarray.array3d(tile), py.surfarray.array_alpha(tile))))
+        return list(colors), np.stack(tiles)
+
     def distance(self, A, B):
         """
-        Calculate great circle distance between two latitude points.
+        Calculate the distance between two latitudes along a meridian.
         
-        Uses simplified Haversine formula for latitudinal distance calculation
-        (assumes longitude difference is zero for this specific use case).
+        With no longitude difference the Haversine formula reduces to the
+        arc length R * dlat.
         
         Args:
             A (float): First latitude in decimal degrees
@@ -126,21 +183,7 @@ class Screen:
             float: Distance in meters between the two latitudes
         """
         R = 6373.0  # Earth radius in kilometers
-        
-        # Convert to radians
-        lat_a = math.radians(A)
-        lat_b = math.radians(B)
-        
-        # Calculate latitudinal difference (longitude difference = 0)
-        dlon = 0
-        dlat = abs(lat_b - lat_a)
-        
-        # Haversine formula
-        a = (math.sin(dlat / 2)**2 + 
-             math.cos(lat_a) * math.cos(lat_b) * math.sin(dlon / 2)**2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        return R * c * 1000  # Convert to meters
+        return R * math.radians(abs(B - A)) * 1000  # Convert to meters
 
     def load_map(self):
         """
@@ -157,13 +200,28 @@ class Screen:
         
         print('Loading satellite imagery and environmental data...')
         
-        # Download satellite images for all background layers
-        png = self.database.load_maps(self.region)
+        # Reuse the imagery saved by a previous run for this region, date and
+        # resolution, otherwise download satellite images for all background layers
+        image_id = f"{self.boundaries}-{self.date.isoformat()}-{self.screen_dimensions}"
+        self.image_tag = hashlib.md5(image_id.encode()).hexdigest()[:8]
+        paths = {key: os.path.join('images', f"{self.image_tag}_{key}.png") for key in self.backgrounds}
+        cached = all(os.path.exists(path) for path in paths.values())
+        if cached:
+            png = paths
+        else:
+            png = self.database.load_maps(self.bounds)
+            os.makedirs('images', exist_ok=True)
         
-        # Load and save each satellite imagery layer
+        # Load and save each satellite imagery layer, converted to the display
+        # pixel format (keeping transparency where the layer has any)
         for key in self.backgrounds:
-            self.backgrounds_dict[key] = py.image.load(png[key])
-            py.image.save(self.backgrounds_dict[key], f"images/{key}.jpg")
+            image = py.image.load(png[key])
+            if image.get_flags() & py.SRCALPHA:
+                self.backgrounds_dict[key] = image.convert_alpha()
+            else:
+                self.backgrounds_dict[key] = image.convert()
+            if not cached:
+                py.image.save(self.backgrounds_dict[key], paths[key])
         
         # Display initial background (satellite map)
         self.screen.blit(self.backgrounds_dict[self.backgrounds[self.i_background]], (0, 0))
@@ -179,8 +237,7 @@ class Screen:
         """
         if self.modification_possible:
             self.fire_visibility = not(self.fire_visibility)
-            self.update_map()
-            self.window.flip()
+            self.redraw_cells()
 
     def update_map(self):
         """
@@ -193,67 +250,146 @@ class Screen:
         - Blue: Water bodies
         - Validation colors: Green (correct prediction), Red (missed fire)
         """
-        # Calculate cell dimensions for grid overlay
-        width, height = [self.screen_dimensions[i] // self.map_dimensions[i] for i in range(2)]
-        
         # Display selected satellite background
         background = self.backgrounds_dict[self.backgrounds[self.i_background]]
         if background:
+            # Layers with transparent areas (FIRMS) use the satellite map as base,
+            # so the static background never shows a previous frame through
+            if background.get_flags() & py.SRCALPHA:
+                self.screen.blit(self.backgrounds_dict['map'], (0, 0))
             self.screen.blit(background, (0, 0))
         else:
             self.screen.fill((0, 200, 0))  # Fallback green background
+        self.static_background = self.screen.copy()
+        self.dirty_rects = []
         
-        # Render fire state overlay for each grid cell
-        for x in range(self.map_dimensions[0]):
-            for y in range(self.map_dimensions[1]):
-                pos = (x * width, y * height)
-                surf = py.Surface((width, height), py.SRCALPHA)  # Transparent overlay
-                parcel = self.map.map[x][y]
-                color = (0, 0, 0, 100)  # Default border color
-                
-                # Determine cell visualization based on state
-                if parcel.water:
-                    # Water bodies (cannot burn)
-                    surf.fill((0, 0, 255, 150))  # Blue with transparency
-                elif parcel.position == self.fire_origin and parcel.s == 0:
-                    # Ignition point before fire starts
-                    surf.fill((255, 255, 255, 200))  # White marker
-                elif self.fire_visibility and self.modification_possible:
-                    # Fire detection validation mode
-                    if parcel.s == 4:  # Completely burned
-                        if parcel.fire:
-                            # Correct prediction: both simulated and detected
-                            surf.fill((0, 200, 0, 200))  # Green
-                        else:
-                            # False negative: simulated but not detected
-                            surf.fill((200, 0, 0, 100))  # Red
-                    elif parcel.fire:
-                        # False positive: detected but not simulated
-                        surf.fill((100, 100, 0, 200))  # Yellow
-                else:
-                    # Normal fire progression visualization
-                    if parcel.s == 1:
-                        # Ignition threshold reached
-                        surf.fill((255, 150, 0, 70))  # Light orange
-                    elif parcel.s == 2:
-                        # Actively burning
-                        surf.fill((255, 0, 0, 150))  # Red
-                    elif parcel.s == 3:
-                        # Fire cooling down
-                        surf.fill((255, 0, 0, 190))  # Dark red
-                    elif parcel.s == 4:
-                        # Completely burned
-                        surf.fill((0, 0, 0, 125))  # Semi-transparent black
-                
-                # Draw cell border and overlay
-                py.draw.rect(surf, color, surf.get_rect(), 1)
-                self.screen.blit(surf, (pos[0], pos[1]))
+        # Assemble the fire state overlay, redrawing the cells whose state changed
+        self.draw_cells()
+        self.dirty_cells.clear()
+        
+        # Render the whole overlay at once
+        self.screen.blit(self.overlay_surface, (0, 0))
         
         # Display current simulation time
-        font = py.font.SysFont('Arial', 40, 'white')
+        self.text_rect = self.draw_time()
+
+    def update_map_incremental(self):
+        """
+        Redraw and present only the cells that changed since the last frame.
+        
+        Restores the dirty cells whose display state changed and the time
+        text area from the static background and the overlay, then updates
+        only those rectangles of the display. Requires a full update_map
+        beforehand.
+        """
+        mask = np.zeros(self.map_dimensions, dtype=bool)
+        if self.dirty_cells:
+            mask[tuple(np.array(list(self.dirty_cells)).T)] = True
+        self.dirty_cells.clear()
+        width, height = self.cell_w, self.cell_h
+        rects = [py.Rect(x * width, y * height, width, height)
+                 for x, y in zip(*self.draw_cells(mask))]
+        rects.append(self.text_rect)
+        
+        # Restore background and overlay under the dirty areas
+        for rect in rects:
+            self.screen.blit(self.static_background, rect, rect)
+            self.screen.blit(self.overlay_surface, rect, rect)
+        
+        self.text_rect = self.draw_time()
+        rects.append(self.text_rect)
+        self.dirty_rects.extend(rects)
+        self.present()
+
+    def redraw_cells(self):
+        """Incrementally redraw every cell whose display state changed."""
+        self.dirty_cells.update(np.ndindex(*self.map_dimensions))
+        self.update_map_incremental()
+
+    def present(self):
+        """
+        Present the dirty screen areas, or the whole screen when none are set.
+        """
+        if self.dirty_rects:
+            py.display.update(self.dirty_rects)
+        else:
+            self.window.flip()
+        self.dirty_rects = []
+
+    def cell_key_array(self):
+        """
+        Determine the display state of every grid cell at once.
+        
+        Returns:
+            ndarray: Index in cell_keys of the state of each cell, indexed [x, y]
+        """
+        shape = self.map_dimensions
+        index = self.cell_index
+        s = self.map.s.reshape(shape)
+        water = self.map.water.reshape(shape)
+        detected = self.map.fire_detected.reshape(shape)
+        
+        # Ignition point before fire starts
+        origin = np.zeros(shape, dtype=bool)
+        origin[self.fire_origin] = s[self.fire_origin] == 0 and self.map.ignite.reshape(shape)[self.fire_origin] == 0
+        
+        # Water bodies (cannot burn) first, then the ignition point
+        conditions = [water, origin]
+        choices = [index['water'], index['origin']]
+        if self.fire_visibility and self.modification_possible:
+            # Fire detection validation mode: correct prediction, false
+            # negative (simulated but not detected), false positive
+            burned = s == 4
+            conditions += [burned & detected, burned, detected]
+            choices += [index['valid_correct'], index['valid_missed'], index['valid_false']]
+            default = index['empty']
+        else:
+            # Normal fire progression visualization
+            default = self.state_keys[s]
+        return np.select(conditions, choices, default)
+
+    def draw_cells(self, mask=None):
+        """
+        Draw the cells whose display state changed into the overlay.
+        
+        Args:
+            mask (ndarray): Cells to consider, indexed [x, y] (all cells if None)
+            
+        Returns:
+            tuple: Grid coordinates (xs, ys) of the redrawn cells
+        """
+        keys = self.cell_key_array()
+        changed = keys != self.overlay_keys
+        if mask is not None:
+            changed &= mask
+        xs, ys = np.nonzero(changed)
+        self.overlay_keys[xs, ys] = keys[xs, ys]
+        
+        # Copy the tiles of all changed cells at once, through views of the
+        # overlay pixels split into (x, cell column, y, cell row) blocks
+        columns, rows = self.map_dimensions
+        width, height = self.cell_w, self.cell_h
+        tiles = self.cell_tiles[keys[xs, ys]]
+        rgb = py.surfarray.pixels3d(self.overlay_surface)[:columns * width, :rows * height]
+        alpha = py.surfarray.pixels_alpha(self.overlay_surface)[:columns * width, :rows * height]
+        rgb.reshape(columns, width, rows, height, 3)[xs, :, ys] = tiles[..., :3]
+        alpha.reshape(columns, width, rows, height)[xs, :, ys] = tiles[..., 3]
+        del rgb, alpha  # Unlock the overlay surface
+        return xs.tolist(), ys.tolist()
+
+    def draw_time(self):
+        """
+        Display the current simulation time.
+        
+        Returns:
+            Rect: Screen area of the time text
+        """
+        # Only render the text again when the displayed minute changes
         time_text = self.actual_time.strftime('%Y/%m/%d, %Hh%M')
-        text_img = font.render(time_text, True, (255, 255, 255))
-        self.screen.blit(text_img, (50, self.screen_dimensions[1] - 70))
+        if time_text != self.time_text:
+            self.time_surface = self.font.render(time_text, True, (255, 255, 255)).convert_alpha()
+            self.time_text = time_text
+        return self.screen.blit(self.time_surface, (50, self.screen_dimensions[1] - 70))
 
     def reset(self):
         """
@@ -262,6 +398,8 @@ class Screen:
         Reloads terrain data, resets fire states, and restores interface
         to allow new simulation execution.
         """
+        if self.simulation_running():
+            return
         print('RESET')
         self.modification_possible = True
         self.actual_time = self.date
@@ -272,40 +410,97 @@ class Screen:
         
         # Update display
         self.update_map()
-        self.window.flip()
+        self.present()
 
     def set_fire(self):
         """
         Execute real-world fire propagation simulation.
         
-        Runs the fire spread algorithm using actual environmental data,
-        tracking performance metrics including execution time and iteration count.
-        Incorporates real temporal progression during simulation.
+        Runs the fire spread algorithm using actual environmental data on a
+        background thread, so the interface keeps handling events while the
+        frames it produces are drawn by the main loop (see process_frames).
         """
-        if self.modification_possible:
-            t = time.time()
-            print('-' * 15)
-            print('FIRE SIMULATION STARTING...')
-            
+        with self.lock:
+            if not self.modification_possible:
+                return
             # Lock interface during simulation
             self.modification_possible = False
-            
-            # Execute fire propagation with real environmental data
-            iterations = self.map.fire(self.fire_origin)
-            
-            # Restore interface control
+        
+        print('-' * 15)
+        print('FIRE SIMULATION STARTING...')
+        self.simulation = threading.Thread(target=self.run_fire, args=(time.time(),), daemon=True)
+        self.simulation.start()
+
+    def run_fire(self, t):
+        """
+        Run the fire propagation simulation, on the simulation thread.
+        
+        Tracks performance metrics including execution time and iteration
+        count. Incorporates real temporal progression during simulation.
+        
+        Args:
+            t (float): Start time of the simulation request
+        """
+        # Execute fire propagation with real environmental data
+        iterations = self.map.fire(self.fire_origin)
+        
+        # Restore interface control and request the final display
+        with self.lock:
             self.modification_possible = True
-            
-            # Update final display
-            self.update_map()
-            self.window.flip()
-            
-            # Report simulation performance
-            execution_time = round(time.time() - t, 2)
-            print(f"SIMULATION COMPLETE - Iterations: {iterations} (Runtime: {execution_time}s)")
-            print('-' * 15)
+        self.frames.put(None)
+        py.event.post(py.event.Event(FRAME_EVENT))
+        
+        # Report simulation performance
+        execution_time = round(time.time() - t, 2)
+        print(f"SIMULATION COMPLETE - Iterations: {iterations} (Runtime: {execution_time}s)")
+        print('-' * 15)
+
+    def simulation_running(self):
+        """
+        Check whether a fire simulation thread is running.
+        
+        Returns:
+            bool: True while the simulation thread is alive
+        """
+        return self.simulation is not None and self.simulation.is_alive()
 
-    def click(self, mouse_pressed):
+    def push_frame(self, cells):
+        """
+        Queue a frame of the running simulation for drawing.
+        
+        Called from the simulation thread; the main loop is woken up by a
+        FRAME_EVENT and draws the queued frames.
+        
+        Args:
+            cells (list): Grid coordinates (x, y) of the cells whose state changed
+        """
+        self.frames.put(cells)
+        py.event.post(py.event.Event(FRAME_EVENT))
+
+    def process_frames(self):
+        """
+        Draw the frames queued by the simulation thread.
+        
+        All frames queued since the last call are merged into a single
+        incremental update; once the simulation ended every cell is redrawn.
+        """
+        finished = False
+        while True:
+            try:
+                cells = self.frames.get_nowait()
+            except queue.Empty:
+                break
+            if cells is None:
+                finished = True
+            else:
+                self.dirty_cells.update(cells)
+        
+        if finished:
+            self.redraw_cells()
+        else:
+            self.update_map_incremental()
+
+    def click(self, pos):
         """
         Handle mouse clicks for terrain parcel inspection.
         
@@ -313,18 +508,14 @@ class Screen:
         including satellite data, weather conditions, and fire state.
         
         Args:
-            mouse_pressed (tuple): Mouse button state from pygame
+            pos (tuple): Screen position of the click
         """
         if self.modification_possible:
-            pos = py.mouse.get_pos()
-            
             # Convert screen coordinates to grid indices
-            width, height = [self.screen_dimensions[i] // self.map_dimensions[i] for i in range(2)]
-            i, j = pos[0] // width, pos[1] // height
+            i, j = pos[0] // self.cell_w, pos[1] // self.cell_h
             
             # Display parcel information
-            print(self.map.map[i][j])
-            time.sleep(0.1)  # Prevent multiple rapid clicks
+            print(self.map.parcel(i, j))
 
     def toggle_background(self):
         """
@@ -345,47 +536,64 @@ class Screen:
             self.screen.blit(self.backgrounds_dict['map'], (0, 0))
         
         # Update display based on simulation state
-        if self.modification_possible:
+        if self.modification_possible or self.simulation_running():
             self.update_map()  # Full update with fire overlay
         else:
             # Just switch background without fire overlay
             self.screen.blit(self.backgrounds_dict[self.backgrounds[self.i_background]], (0, 0))
         
-        self.window.flip()
+        self.present()
 
 
-# Application initialization and main event loop
-py.init()
-screen = Screen(py.display, 0.3)
+# Keyboard controls
+KEYMAP = {
+    py.K_f: Screen.set_fire,                  # Start fire simulation
+    py.K_RETURN: lambda screen: sys.exit(),   # Exit application
+    py.K_r: Screen.reset,                     # Reset simulation
+    py.K_t: Screen.toggle_fire_filter,        # Toggle fire validation overlay
+    py.K_u: Screen.toggle_background          # Switch satellite imagery layer
+}
 
-print("\nReal-World Forest Fire Simulation")
-print("Controls:")
-print("- Press 'F' to start fire simulation")
-print("- Press 'R' to reset simulation")
-print("- Press 'T' to toggle fire detection validation")
-print("- Press 'U' to cycle satellite imagery layers")
-print("- Click parcels to view environmental data")
-print("- Press 'ENTER' to exit")
 
-while True:
-    for event in py.event.get():
-        if event.type == py.QUIT:
-            sys.exit()
-            
-        if event.type == py.KEYDOWN:
-            if event.key == py.K_f:          # Start fire simulation
-                screen.set_fire()
-            if event.key == py.K_RETURN:     # Exit application
-                sys.exit()
-            if event.key == py.K_r:          # Reset simulation
-                screen.reset()
-            if event.key == py.K_t:          # Toggle fire validation overlay
-                screen.toggle_fire_filter()
-            if event.key == py.K_u:          # Switch satellite imagery layer
-                screen.toggle_background()
-
-    # Handle mouse clicks for parcel inspection
-    if py.mouse.get_pressed():
-        mouse_state = py.mouse.get_pressed()
-        if mouse_state == (1, 0, 0) or mouse_state == (0, 0, 1):  # Left or right click
-            screen.click(mouse_state)
\ No newline at end of file
+def main():
+    """
+    Application initialization and main event loop.
+    
+    Opens the simulation interface and dispatches user input until exit.
+    """
+    py.init()
+    screen = Screen(py.display, 0.3)
+
+    print("\nReal-World Forest Fire Simulation")
+    print("Controls:")
+    print("- Press 'F' to start fire simulation")
+    print("- Press 'R' to reset simulation")
+    print("- Press 'T' to toggle fire detection validation")
+    print("- Press 'U' to cycle satellite imagery layers")
+    print("- Click parcels to view environmental data")
+    print("- Press 'ENTER' to exit")
+
+    # The database is closed on exit, writing any environmental data still buffered
+    with screen.database:
+        while True:
+            # Block until an event arrives, then handle everything queued with it
+            for event in [py.event.wait()] + py.event.get():
+                if event.type == py.QUIT:
+                    sys.exit()
+                
+                if event.type == py.KEYDOWN:
+                    handler = KEYMAP.get(event.key)
+                    if handler:
+                        handler(screen)
+
+                # Draw the frames of a running fire simulation
+                if event.type == FRAME_EVENT:
+                    screen.process_frames()
+
+                # Handle mouse clicks for parcel inspection
+                if event.type == py.MOUSEBUTTONDOWN and event.button in (1, 3):  # Left or right click
+                    screen.click(event.pos)
+
+
+if __name__ == "__main__":
+    main()
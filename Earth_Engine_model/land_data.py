@@ -25,9 +25,54 @@ Features:
 @version 1.0.0
 """
 
-import ee, ssl, sqlite3, math, urllib.request, io
+import ee, ssl, sqlite3, urllib3, io, shutil, threading, hashlib, ast, logging
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from dateutil.relativedelta import relativedelta
 
+logger = logging.getLogger(__name__)
+
+# Earth Engine endpoint meant for many concurrent automated requests
+EE_HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+
+# Number of new Land rows buffered before they are written in one transaction
+FLUSH_ROWS = 500
+
+# Imagery layers, in the column order of the Images table
+IMAGE_LAYERS = ('elevation', 'temperature', 'treecover', 'firms', 'map')
+
+# Number of regions whose imagery is kept in memory
+IMAGE_CACHE_SIZE = 5
+
+# Chunk size used to stream downloaded imagery (bytes)
+DOWNLOAD_CHUNK = 1 << 16
+
+# Number of neighbouring regions whose imagery is prefetched at the same time
+PREFETCH_WORKERS = 2
+
+# Insert statements, kept constant so the connection reuses their compiled form
+LAND_INSERT = '''INSERT OR IGNORE INTO Land (latitude, longitude, date, temp, humidity,
+                 windspeed, winddir, elevation, treecover, fire)
+                 VALUES (?,?,?,?,?,?,?,?,?,?)'''
+IMAGES_INSERT = '''INSERT INTO Images (region, date, elevation, temperature, treecover, firms, map)
+                   VALUES (?,?,?,?,?,?,?)'''
+
+# Approximate length of a degree of latitude (meters)
+METERS_PER_DEGREE = 111000
+
+# Closest cached Land row of a date within a box around a coordinate, the
+# CROSS JOIN makes SQLite search the R-Tree first instead of every row of the date
+NEARBY_QUERY = '''SELECT Land.latitude, Land.longitude, Land.date, Land.elevation, Land.treecover,
+                  Land.fire, Land.temp, Land.humidity, Land.windspeed, Land.winddir
+                  FROM LandRTree CROSS JOIN Land ON Land.rowid = LandRTree.id
+                  WHERE LandRTree.maxLat >= :lat - :delta AND LandRTree.minLat <= :lat + :delta
+                  AND LandRTree.maxLon >= :lon - :delta AND LandRTree.minLon <= :lon + :delta
+                  AND Land.date = :date
+                  ORDER BY (Land.latitude - :lat) * (Land.latitude - :lat)
+                           + (Land.longitude - :lon) * (Land.longitude - :lon)
+                  LIMIT 1'''
+
 def create_database(db_file):
     """
     Create SQLite database for environmental data caching.
@@ -56,6 +101,8 @@ def create_database(db_file):
          fire BOOL, date DATE, temp FLOAT, humidity FLOAT, 
          windspeed FLOAT, winddir FLOAT, 
          PRIMARY KEY (latitude, longitude, date));''')
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_land_date ON Land(date)''')
+        spatial_index(conn)
         print(f"Environmental data database created: {db_file}")
     except sqlite3.Error as e:
         print(f"Database creation error: {e}")
@@ -82,6 +129,7 @@ def image_database(db_file):
         (region VARCHAR, date DATE, map VARBINARY, elevation VARBINARY, 
          temperature VARBINARY, treecover VARBINARY, firms VARBINARY, 
          PRIMARY KEY (region, date));''')
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_images_date ON Images(date)''')
         print(f"Satellite imagery database created: {db_file}")
     except sqlite3.Error as e:
         print(f"Image database creation error: {e}")
@@ -113,6 +161,79 @@ def clear_database(db_file, table):
         if conn:
             conn.close()
 
+def spatial_index(conn):
+    """
+    Create the R-Tree spatial index of the Land table.
+    
+    The index holds the position of every Land row and is kept in sync by
+    triggers; rows stored before the index existed are added to it.
+    
+    Args:
+        conn (sqlite3.Connection): Connection to the environmental database
+    """
+    conn.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS LandRTree
+                    USING rtree(id, minLat, maxLat, minLon, maxLon)''')
+    conn.execute('''CREATE TRIGGER IF NOT EXISTS land_rtree_insert AFTER INSERT ON Land
+                    BEGIN
+                        INSERT OR REPLACE INTO LandRTree
+                        VALUES (new.rowid, new.latitude, new.latitude, new.longitude, new.longitude);
+                    END''')
+    conn.execute('''CREATE TRIGGER IF NOT EXISTS land_rtree_delete AFTER DELETE ON Land
+                    BEGIN
+                        DELETE FROM LandRTree WHERE id = old.rowid;
+                    END''')
+    conn.execute('''INSERT INTO LandRTree
+                    SELECT rowid, latitude, latitude, longitude, longitude FROM Land
+                    WHERE rowid NOT IN (SELECT id FROM LandRTree)''')
+
+def region_key(bounds):
+    """
+    Build the imagery cache key of a rectangular region.
+    
+    The key is a hash of the bounds rounded to the coordinate precision,
+    so it does not depend on how the coordinates are formatted.
+    
+    Args:
+        bounds (tuple): Region bounds (west, south, east, north)
+        
+    Returns:
+        str: Region key of the Images table
+    """
+    canonical = repr(tuple(round(float(value), 6) for value in bounds))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+def fetch_records(cursor):
+    """
+    Fetch the remaining rows of a query as dictionaries of column names to values.
+    
+    The column names are read once per query instead of once per row.
+    
+    Args:
+        cursor (sqlite3.Cursor): Cursor of an executed query
+        
+    Returns:
+        list: Row values by column name
+    """
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+def wind_from_components(u_component, v_component):
+    """
+    Calculate wind speed and direction from its components.
+    
+    Works on single values as well as NumPy arrays of many samples at once.
+    
+    Args:
+        u_component (float or ndarray): East-west wind component (m/s)
+        v_component (float or ndarray): North-south wind component (m/s)
+        
+    Returns:
+        tuple: Wind speed (m/s) and direction (degrees from north)
+    """
+    windspeed = np.hypot(u_component, v_component)
+    winddir = (180 + np.degrees(np.arctan2(v_component, u_component))) % 360
+    return windspeed, winddir
+
 class Database():
     """
     Main interface to Google Earth Engine environmental data services.
@@ -120,9 +241,12 @@ class Database():
     Manages data retrieval from multiple satellite and weather databases,
     implements local caching for performance, and provides processed
     environmental data for fire simulation models.
+    
+    All methods share a single connection to the local database, opened once
+    and used from the worker threads under the lock of the instance.
     """
     
-    def __init__(self, date, screen_dimensions, scale):
+    def __init__(self, date, screen_dimensions, scale, prefetch=False):
         """
         Initialize the Earth Engine data interface.
         
@@ -133,6 +257,8 @@ class Database():
             date (datetime): Simulation date for temporal data queries
             screen_dimensions (tuple): Display resolution for image generation
             scale (float): Spatial resolution in meters per pixel
+            prefetch (bool): Download the imagery of the neighbouring regions
+                in the background once a region is loaded
         """
         self.date = date                        # Simulation temporal context
         self.screen_dimensions = screen_dimensions  # Image output resolution
@@ -140,14 +266,45 @@ class Database():
         
         # Local data storage
         self.init_data = []                     # Cached environmental data
-        self.init_images = []                   # Cached satellite imagery
+        self.init_data_index = {}               # Cached data by (latitude, longitude)
+        self.image_index = {}                   # Cached imagery by region key
+        self.image_cache = OrderedDict()        # Recently used imagery layers by region key
+        self.prefetch = prefetch                # Background imagery prefetching enabled
+        self.prefetching = {}                   # Imagery prefetches in progress by region key
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
         self.db_file = 'database/pythonsqlite.db'  # Local database path
         
+        # Persistent connection to the local database, in WAL mode so that
+        # each batch of rows costs a single commit
+        self.conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False,
+                                    cached_statements=256)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-65536')      # 64 MB page cache
+        self.conn.execute('PRAGMA mmap_size=268435456')    # 256 MB memory map
+        
+        # Cached data is loaded by date, which the primary keys cannot serve
+        try:
+            self.conn.execute('''CREATE INDEX IF NOT EXISTS idx_land_date ON Land(date)''')
+            self.conn.execute('''CREATE INDEX IF NOT EXISTS idx_images_date ON Images(date)''')
+            spatial_index(self.conn)    # Nearby cached data lookup
+        except sqlite3.Error as e:
+            logger.error("Index creation error: %s", e)
+        self.pending_rows = []                  # Land rows waiting to be written
+        self.lock = threading.Lock()            # Guards the pending rows, prefetches, image cache and connection
+        
         # Network configuration for secure data retrieval
-        self.gcontext = ssl.SSLContext()
-        self.locations = []                     # Processed coordinate list
+        # Verifying context (certificate and hostname), its CA store loaded
+        # once and shared by every pooled connection
+        self.gcontext = ssl.create_default_context()
+        # Keep-alive HTTPS connections shared by all imagery downloads, one per
+        # layer downloaded concurrently plus one per prefetch worker
+        self.http = urllib3.PoolManager(num_pools=2, maxsize=len(IMAGE_LAYERS) + PREFETCH_WORKERS,
+                                        ssl_context=self.gcontext)
         
         # Initialize data systems
+        self.migrate_region_keys()  # Convert legacy imagery keys
         self.get_init_data()    # Load existing cached data
         self.init_datasets()    # Configure Earth Engine datasets
 
@@ -159,33 +316,58 @@ class Database():
         been previously downloaded for the simulation date, enabling
         fast local access without repeated API calls.
         """
-        conn = None
         try:
-            conn = sqlite3.connect(self.db_file)
-            cur = conn.cursor()
-            
             # Load environmental data for simulation date
-            cur.execute('''SELECT * FROM Land WHERE date=?''', [self.date])
-            response = cur.fetchall()
-            desc = [x[0] for x in cur.description]
-            for x in response:
-                self.init_data.append(dict(zip(desc, x)))
+            self.init_data = fetch_records(self.conn.execute('''SELECT latitude, longitude, date, elevation,
+                                                             treecover, fire, temp, humidity, windspeed,
+                                                             winddir FROM Land WHERE date=?''', [self.date]))
+            self.init_data_index = {(record['latitude'], record['longitude']): record
+                                    for record in self.init_data}
             
-            # Load cached satellite imagery for simulation date
-            cur.execute('''SELECT * FROM Images WHERE date=?''', [self.date])
-            response = cur.fetchall()
-            desc = [x[0] for x in cur.description]
-            for x in response:
-                self.init_images.append(dict(zip(desc, x)))
+            # Index cached satellite imagery for simulation date, the image
+            # data itself is only read when its region is requested
+            images = fetch_records(self.conn.execute('''SELECT rowid, region, date FROM Images
+                                                     WHERE date=?''', [self.date]))
+            self.image_index = {image['region']: image for image in images}
                 
             print(f"Loaded {len(self.init_data)} cached environmental records")
-            print(f"Loaded {len(self.init_images)} cached image sets")
+            print(f"Loaded {len(self.image_index)} cached image sets")
 
         except sqlite3.Error as e:
-            print(f"Data loading error: {e}")
-        finally:
-            if conn:
-                conn.close()
+            logger.error("Data loading error: %s", e)
+
+    def migrate_region_keys(self):
+        """
+        Convert imagery cached under legacy region keys to hashed keys.
+        
+        Earlier versions keyed the Images table by the string of the closed
+        (longitude, latitude) region polygon; those rows are re-keyed with
+        region_key of the polygon bounds so they remain cache hits.
+        
+        A legacy row whose new key is already used for its date (the same
+        region written with other coordinates, or downloaded again since) is
+        a duplicate and is deleted, the row holding the key is kept. All rows
+        are migrated in a single transaction, the table is left unchanged if
+        any of them fails.
+        """
+        with self.lock:
+            try:
+                self.conn.execute('BEGIN')
+                legacy = self.conn.execute("""SELECT rowid, region, date FROM Images
+                                              WHERE region LIKE '[%'""").fetchall()
+                for rowid, region, date in legacy:
+                    longitudes, latitudes = zip(*ast.literal_eval(region))
+                    key = region_key((min(longitudes), min(latitudes), max(longitudes), max(latitudes)))
+                    if self.conn.execute('''SELECT 1 FROM Images WHERE region=? AND date=?''',
+                                         (key, date)).fetchone():
+                        self.conn.execute('''DELETE FROM Images WHERE rowid=?''', (rowid,))
+                    else:
+                        self.conn.execute('''UPDATE Images SET region=? WHERE rowid=?''', (key, rowid))
+                self.conn.execute('COMMIT')
+            except (sqlite3.Error, ValueError, SyntaxError) as e:
+                logger.error("Image key migration error: %s", e)
+                if self.conn.in_transaction:
+                    self.conn.execute('ROLLBACK')
 
     def init_datasets(self):
         """
@@ -201,12 +383,19 @@ class Database():
         - FIRMS: Active fire detection from satellite sensors
         - Landsat: High-resolution optical satellite imagery
         """
-        # Initialize Google Earth Engine API
-        ee.Initialize()
+        # Initialize Google Earth Engine API on the high-volume endpoint, as
+        # sampling batches and imagery layers are requested concurrently
+        ee.Initialize(opt_url=EE_HIGH_VOLUME_URL)
         
-        # Calculate temporal windows for different data types
-        i_date = (self.date - relativedelta(hours=2)).strftime('%Y-%m-%dT%H:%M')
-        f_date = (self.date + relativedelta(months=1)).strftime('%Y-%m-%dT%H:%M')
+        # Temporal windows (start, end) of the time-dependent datasets
+        windows = {
+            'atmosphere': ((self.date - relativedelta(hours=2)).strftime('%Y-%m-%dT%H:%M'),
+                           (self.date + relativedelta(hours=6)).strftime('%Y-%m-%dT%H:%M')),
+            'firms': (self.date.strftime('%Y-%m-%d'),
+                      (self.date + relativedelta(days=2)).strftime('%Y-%m-%d')),
+            'landsat': (self.date.strftime('%Y-%m-%d'),
+                        (self.date + relativedelta(days=30)).strftime('%Y-%m-%d'))
+        }
         
         # Global vegetation coverage data (100m resolution)
         # Source: COPERNICUS Landcover dataset
@@ -218,19 +407,57 @@ class Database():
         
         # Real-time atmospheric conditions (6-hour forecast window)
         # Source: NOAA Global Forecast System
-        f_date = (self.date + relativedelta(hours=6)).strftime('%Y-%m-%dT%H:%M')
-        self.atmosphere = ee.ImageCollection("NOAA/GFS0P25").filter(ee.Filter.date(i_date, f_date))
+        self.atmosphere = ee.ImageCollection("NOAA/GFS0P25").filter(ee.Filter.date(*windows['atmosphere']))
         
         # Active fire detection data (2-day window)
         # Source: NASA Fire Information for Resource Management System
-        i_date = self.date.strftime('%Y-%m-%d')
-        f_date = (self.date + relativedelta(days=2)).strftime('%Y-%m-%d')
-        self.firms = ee.ImageCollection("FIRMS").filter(ee.Filter.date(i_date, f_date))
+        self.firms = ee.ImageCollection("FIRMS").filter(ee.Filter.date(*windows['firms']))
         
         # High-resolution satellite imagery (30-day window for cloud-free images)
         # Source: Landsat 8 Collection 1 Tier 1
-        f_date = (self.date + relativedelta(days=30)).strftime('%Y-%m-%d')
-        self.landsat = ee.ImageCollection("LANDSAT/LC08/C01/T1").filter(ee.Filter.date(i_date, f_date))
+        self.landsat = ee.ImageCollection("LANDSAT/LC08/C01/T1").filter(ee.Filter.date(*windows['landsat']))
+        
+        # Images of the filtered collections, bound once and shared by the
+        # sampling image and the visualization layers
+        self.vegetation_image = self.vegetation.first()
+        self.atmosphere_image = self.atmosphere.first()
+        self.firms_image = self.firms.first()
+        
+        # All datasets stacked into one image for bulk point sampling, with
+        # fire detection as a mask band, clear when FIRMS has no image
+        firms = ee.Image(ee.Algorithms.If(self.firms.size().gt(0),
+                                          self.firms_image.select('T21').mask(),
+                                          ee.Image(0))).rename('fire')
+        self.samples_image = (self.elevation.select('elevation')
+                              .addBands(self.vegetation_image.select('tree-coverfraction'))
+                              .addBands(self.atmosphere_image.select([
+                                  'temperature_2m_above_ground', 'relative_humidity_2m_above_ground',
+                                  'u_component_of_wind_10m_above_ground',
+                                  'v_component_of_wind_10m_above_ground']))
+                              .addBands(firms))
+        
+        # Visualization layers and their display parameters, built once so
+        # every thumbnail request reuses the same Earth Engine image graph
+        self.layers = {
+            # Elevation map with terrain visualization
+            'elevation': (self.elevation.updateMask(self.elevation.gt(0)),
+                          {'min': 0, 'max': 700,
+                           'palette': ['006633', 'E5FFCC', '662A00', 'D8D8D8', 'F5F5F5']}),
+            # Temperature map with thermal color scale
+            'temperature': (self.atmosphere_image.select('temperature_2m_above_ground'),
+                            {'min': -40.0, 'max': 35.0,
+                             'palette': ['blue', 'purple', 'cyan', 'green', 'yellow', 'red']}),
+            # Tree coverage map with vegetation color scale
+            'treecover': (self.vegetation_image.select('tree-coverfraction'),
+                          {'min': 0, 'max': 100, 'palette': ['black', 'brown', 'yellow', 'green']}),
+            # Fire detection map with heat visualization
+            'firms': (self.firms_image.select('T21'),
+                      {'min': 325, 'max': 400, 'palette': ['red', 'orange', 'yellow']}),
+            # True-color satellite imagery from Landsat, opaque and photographic
+            # so it is downloaded as a much smaller JPEG than the PNG default
+            'map': (self.landsat.mosaic(),
+                    {'min': 0, 'max': 30000, 'bands': ['B4', 'B3', 'B2'], 'format': 'jpg'})
+        }
         
         print(f'Earth Engine datasets initialized, spatial scale: {self.scale}m')
 
@@ -257,94 +484,213 @@ class Database():
                 - winddir: Wind direction (degrees from north)
                 - fire: Fire detection status (boolean)
         """
-        # Check if data exists in local cache
-        init_data_locations = [(x['latitude'], x['longitude']) for x in self.init_data]
-        coord_key = (coords['latitude'], coords['longitude'])
-        
-        if coord_key in init_data_locations:
-            # Return cached data
-            for cached_data in self.init_data:
-                if coord_key == (cached_data['latitude'], cached_data['longitude']):
-                    return cached_data
+        # Return cached data if it exists in local cache
+        cached_data = self.init_data_index.get((coords['latitude'], coords['longitude']))
+        if cached_data is None:
+            cached_data = self.nearby_data(coords)
+        if cached_data is not None:
+            return cached_data
         else:
-            # Query Google Earth Engine for new data
+            # Query Google Earth Engine for new data, every dataset is read
+            # from the stacked sampling image in a single round trip
             point = ee.Geometry.Point(coords['longitude'], coords['latitude'])
+            sample = self.samples_image.reduceRegion(ee.Reducer.first(), point, self.scale).getInfo()
 
-            # Fire detection from NASA FIRMS
-            try:
-                firms_sample = self.firms.first().sample(point, self.scale).first().getInfo()
-                fire = (firms_sample is not None)
-            except:
-                fire = False  # No fire detected or data unavailable
-
-            # Vegetation data from COPERNICUS
-            vegetation_sample = self.vegetation.first().sample(point, self.scale).first()
-            treecover = vegetation_sample.get("tree-coverfraction").getInfo()
-
-            # Elevation from USGS SRTM
-            elevation = self.elevation.sample(point, self.scale).first().get('elevation').getInfo()
-
-            # Atmospheric conditions from NOAA GFS
-            atmosphere_sample = self.atmosphere.first().sample(point, self.scale).first()
-            temperature = atmosphere_sample.get('temperature_2m_above_ground').getInfo()
-            humidity = atmosphere_sample.get('relative_humidity_2m_above_ground').getInfo()
-            
-            # Wind components (u = east-west, v = north-south)
-            u_component = atmosphere_sample.get('u_component_of_wind_10m_above_ground').getInfo()
-            v_component = atmosphere_sample.get('v_component_of_wind_10m_above_ground').getInfo()
-
-            # Calculate wind speed and direction from components
-            windspeed = math.sqrt(u_component**2 + v_component**2)
-            winddir = (180 + 180/math.pi * math.atan2(v_component, u_component)) % 360
+            # Wind components (u = east-west, v = north-south), masked
+            # components are treated as calm air
+            windspeed, winddir = wind_from_components(
+                sample.get('u_component_of_wind_10m_above_ground') or 0.0,
+                sample.get('v_component_of_wind_10m_above_ground') or 0.0)
 
             # Compile complete environmental profile
-            environmental_data = {
-                'date': self.date,
-                'latitude': coords['latitude'],
-                'longitude': coords['longitude'],
-                'elevation': elevation,
-                'treecover': treecover,
-                'temp': temperature,
-                'humidity': humidity,
-                'windspeed': windspeed,
-                'winddir': winddir,
-                'fire': fire
-            }
+            environmental_data = self.environmental_profile(
+                coords, sample.get('elevation'), sample.get('tree-coverfraction'),
+                sample.get('temperature_2m_above_ground'), sample.get('relative_humidity_2m_above_ground'),
+                float(windspeed), float(winddir), bool(sample.get('fire')))
             
             # Cache data locally for future use
             self.add_data(environmental_data)
             return environmental_data
 
+    def nearby_data(self, coords):
+        """
+        Look up environmental data cached close to specific coordinates.
+        
+        Data sampled at most half a sampling cell away is taken as the data of
+        the coordinates, so slightly different coordinates reuse the cache
+        instead of querying Earth Engine again.
+        
+        Args:
+            coords (dict): Geographic coordinates with 'latitude' and 'longitude' keys
+            
+        Returns:
+            dict: Environmental data profile at coords (see land_data), None if
+                no data was cached nearby
+        """
+        delta = self.scale / 2 / METERS_PER_DEGREE
+        with self.lock:
+            records = fetch_records(self.conn.execute(NEARBY_QUERY, {
+                'lat': coords['latitude'], 'lon': coords['longitude'], 'delta': delta, 'date': self.date}))
+            if not records:
+                return None
+            
+            # Cached for these exact coordinates from now on
+            data = dict(records[0], latitude=coords['latitude'], longitude=coords['longitude'])
+            self.init_data_index[(data['latitude'], data['longitude'])] = data
+        return data
+
+    def environmental_profile(self, coords, elevation, treecover, temperature, humidity,
+                              windspeed, winddir, fire):
+        """
+        Assemble the environmental data profile of a coordinate from its samples.
+        
+        Args:
+            coords (dict): Geographic coordinates with 'latitude' and 'longitude' keys
+            elevation (float): Height above sea level (meters)
+            treecover (float): Vegetation coverage percentage (0-100)
+            temperature (float): Temperature at 2m above ground (Celsius)
+            humidity (float): Relative humidity percentage (0-100)
+            windspeed (float): Wind speed magnitude (m/s)
+            winddir (float): Wind direction (degrees from north)
+            fire (bool): Fire detection status
+            
+        Returns:
+            dict: Complete environmental data profile (see land_data)
+        """
+        return {
+            'date': self.date,
+            'latitude': coords['latitude'],
+            'longitude': coords['longitude'],
+            'elevation': elevation,
+            'treecover': treecover,
+            'temp': temperature,
+            'humidity': humidity,
+            'windspeed': windspeed,
+            'winddir': winddir,
+            'fire': fire
+        }
+
+    def land_data_batch(self, coords_list, max_workers=32):
+        """
+        Retrieve environmental data for many coordinates at once.
+        
+        Cached coordinates are answered locally; the Earth Engine queries of
+        the others are I/O bound, so they are pipelined over a thread pool
+        instead of waiting on one round trip after the other.
+        
+        Args:
+            coords_list (list): Coordinates dicts with 'latitude' and 'longitude' keys
+            max_workers (int): Number of concurrent Earth Engine requests
+            
+        Returns:
+            list: Environmental data profiles (see land_data), in input order
+        """
+        environmental_data = [self.init_data_index.get((coords['latitude'], coords['longitude']))
+                              for coords in coords_list]
+        missing = [i for i, data in enumerate(environmental_data) if data is None]
+        
+        if missing:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for i, data in zip(missing, executor.map(self.land_data, [coords_list[i] for i in missing])):
+                    environmental_data[i] = data
+        self.flush_data()
+        return environmental_data
+
+    def land_data_bulk(self, coords_list, batch_size=5000):
+        """
+        Retrieve environmental data for many coordinates with batched queries.
+        
+        Cached coordinates are answered locally. All other coordinates are
+        sampled together: every dataset is stacked into a single image which
+        is sampled at all points by one sampleRegions query per batch,
+        instead of several getInfo() round trips per coordinate. Points the
+        bulk query cannot sample (masked pixels) fall back to land_data.
+        
+        Args:
+            coords_list (list): Coordinates dicts with 'latitude' and 'longitude' keys
+            batch_size (int): Maximum number of points per Earth Engine query
+            
+        Returns:
+            list: Environmental data profiles (see land_data), in input order
+        """
+        missing = {}
+        for coords in coords_list:
+            coord_key = (coords['latitude'], coords['longitude'])
+            if coord_key not in self.init_data_index and self.nearby_data(coords) is None:
+                missing.setdefault(coord_key, coords)
+        missing = list(missing.values())
+        
+        if missing:
+            for start in range(0, len(missing), batch_size):
+                batch = missing[start:start + batch_size]
+                points = ee.FeatureCollection([
+                    ee.Feature(ee.Geometry.Point(coords['longitude'], coords['latitude']), {'index': i})
+                    for i, coords in enumerate(batch)])
+                samples = self.samples_image.sampleRegions(collection=points, scale=self.scale,
+                                                           geometries=False).getInfo()
+                samples = [feature['properties'] for feature in samples['features']]
+                
+                # Wind speed and direction of the whole batch at once
+                windspeed, winddir = wind_from_components(
+                    np.array([sample['u_component_of_wind_10m_above_ground'] for sample in samples], dtype=float),
+                    np.array([sample['v_component_of_wind_10m_above_ground'] for sample in samples], dtype=float))
+                
+                for sample, speed, direction in zip(samples, windspeed.tolist(), winddir.tolist()):
+                    environmental_data = self.environmental_profile(
+                        batch[sample['index']], sample['elevation'], sample['tree-coverfraction'],
+                        sample['temperature_2m_above_ground'], sample['relative_humidity_2m_above_ground'],
+                        speed, direction, sample['fire'] > 0)
+                    self.add_data(environmental_data)
+        
+        # Every coordinate is cached now, except the ones left to land_data
+        return self.land_data_batch(coords_list)
+
     def add_data(self, data):
         """
-        Add newly retrieved environmental data to local cache database.
+        Add newly retrieved environmental data to local cache.
         
-        Stores complete environmental data profile in SQLite database
-        for fast future retrieval without repeated API calls.
+        The data is available from the in-memory cache at once, while its
+        database row is buffered and written with the next batch of rows
+        (see flush_data) for fast future retrieval without repeated API calls.
         
         Args:
             data (dict): Environmental data dictionary to cache
         """
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_file)
-            cur = conn.cursor()
-            cur.execute(f'''INSERT INTO Land (latitude, longitude, date, temp, humidity, 
-                           windspeed, winddir, elevation, treecover, fire)
-                           VALUES (?,?,?,?,?,?,?,?,?,?)''',
-                       (data['latitude'], data['longitude'], data['date'], data['temp'],
-                        data['humidity'], data['windspeed'], data['winddir'],
-                        data['elevation'], data['treecover'], data['fire']))
-            conn.commit()
-        except sqlite3.Error as e:
-            print(f"Data insertion error: {e}")
-        finally:
+        with self.lock:
+            self.pending_rows.append(
+                (data['latitude'], data['longitude'], data['date'], data['temp'],
+                 data['humidity'], data['windspeed'], data['winddir'],
+                 data['elevation'], data['treecover'], data['fire']))
+            
             # Update local cache
             self.init_data.append(data)
-            if conn:
-                conn.close()
+            self.init_data_index[(data['latitude'], data['longitude'])] = data
+            logger.debug("cached %s, %s", data['latitude'], data['longitude'])
+            full = len(self.pending_rows) >= FLUSH_ROWS
+        
+        if full:
+            self.flush_data()
+
+    def flush_data(self):
+        """
+        Write the buffered environmental data rows to the local database.
+        
+        All pending rows are inserted in a single transaction.
+        """
+        with self.lock:
+            rows, self.pending_rows = self.pending_rows, []
+            if not rows:
+                return
+            try:
+                self.conn.execute('BEGIN')
+                self.conn.executemany(LAND_INSERT, rows)
+                self.conn.execute('COMMIT')
+            except sqlite3.Error as e:
+                logger.error("Data insertion error: %s", e)
+                if self.conn.in_transaction:
+                    self.conn.execute('ROLLBACK')
 
-    def load_maps(self, boundaries):
+    def load_maps(self, bounds):
         """
         Generate satellite imagery maps for visualization layers.
         
@@ -355,89 +701,166 @@ class Database():
         - FIRMS: Fire detection overlay
         - Landsat: True-color satellite imagery
         
+        When prefetching is enabled, the imagery of the neighbouring regions
+        is then downloaded in the background (see prefetch_maps).
+        
         Args:
-            boundaries (list): Polygon coordinates defining the region of interest
+            bounds (tuple): Region of interest (west, south, east, north)
             
         Returns:
             dict: Collection of satellite imagery layers as BytesIO objects
         """
-        region = ee.Geometry.Polygon(boundaries)
+        region_id = region_key(bounds)
+        
+        # A region being prefetched is waited for rather than downloaded twice
+        with self.lock:
+            pending = self.prefetching.get(region_id)
+        if pending is not None:
+            wait([pending])
         
         # Check for cached imagery
-        cached_images = [img for img in self.init_images if img['region'] == str(boundaries)]
+        cached_image = self.image_index.get(region_id)
         
-        if not cached_images:
+        if cached_image is None:
             print("Generating satellite imagery from Earth Engine...")
             
-            # Elevation map with terrain visualization
-            elevation_image = self.elevation.updateMask(self.elevation.gt(0))
-            elevation_url = elevation_image.getThumbURL({
-                'min': 0, 'max': 700, 'region': region, 'dimensions': self.screen_dimensions,
-                'palette': ['006633', 'E5FFCC', '662A00', 'D8D8D8', 'F5F5F5']
-            })
-            elevation_response = urllib.request.urlopen(elevation_url, context=self.gcontext)
-            elevation_png = io.BytesIO(elevation_response.read())
-
-            # Temperature map with thermal color scale
-            temperature_image = self.atmosphere.first().select('temperature_2m_above_ground')
-            temperature_url = temperature_image.getThumbURL({
-                'min': -40.0, 'max': 35.0, 'region': region, 'dimensions': self.screen_dimensions,
-                'palette': ['blue', 'purple', 'cyan', 'green', 'yellow', 'red'],
-            })
-            temperature_response = urllib.request.urlopen(temperature_url, context=self.gcontext)
-            temperature_png = io.BytesIO(temperature_response.read())
-
-            # Tree coverage map with vegetation color scale
-            treecover_image = self.vegetation.first().select('tree-coverfraction')         
-            treecover_url = treecover_image.getThumbURL({
-                'min': 0, 'max': 100, 'region': region, 'dimensions': self.screen_dimensions,
-                'palette': ['black', 'brown', 'yellow', 'green'],
-            })
-            treecover_response = urllib.request.urlopen(treecover_url, context=self.gcontext)
-            treecover_png = io.BytesIO(treecover_response.read())
-
-            # Fire detection map with heat visualization
-            firms_image = self.firms.first().select('T21')
-            firms_url = firms_image.getThumbURL({
-                'min': 325, 'max': 400, 'region': region, 'dimensions': self.screen_dimensions,
-                "palette": ['red', 'orange', 'yellow'],
-            })
-            firms_response = urllib.request.urlopen(firms_url, context=self.gcontext)
-            firms_png = io.BytesIO(firms_response.read())
- 
-            # True-color satellite imagery from Landsat
-            satellite_image = self.landsat.mosaic()
-            satellite_url = satellite_image.getThumbURL({
-                'min': 0, 'max': 30000, 'bands': ['B4', 'B3', 'B2'],
-                'region': region, 'dimensions': self.screen_dimensions,
-            })
-            satellite_response = urllib.request.urlopen(satellite_url, context=self.gcontext)
-            satellite_png = io.BytesIO(satellite_response.read())
-
-            # Compile imagery collection
-            imagery_data = {
-                'elevation': elevation_png,
-                'date': self.date,
-                'temperature': temperature_png,
-                'treecover': treecover_png,
-                'firms': firms_png,
-                'map': satellite_png,
-                'region': boundaries
-            }
+            # Layers are independent downloads, fetch them concurrently
+            region = ee.Geometry.Rectangle(list(bounds))
+            imagery_data = self.download_maps(region, region_id, len(self.layers))
             
             # Cache imagery for future use
             self.add_images_to_database(imagery_data)
-            return imagery_data
         else:
-            # Return cached imagery
-            cached_data = cached_images[0]
-            cached_data['elevation'] = io.BytesIO(cached_data['elevation'])
-            cached_data['temperature'] = io.BytesIO(cached_data['temperature'])
-            cached_data['treecover'] = io.BytesIO(cached_data['treecover'])
-            cached_data['firms'] = io.BytesIO(cached_data['firms'])
-            cached_data['map'] = io.BytesIO(cached_data['map'])
+            # Recently used imagery is kept in memory, older one is read back
+            with self.lock:
+                layers = self.image_cache.get(region_id)
+                if layers is not None:
+                    self.image_cache.move_to_end(region_id)
+            if layers is None:
+                with self.lock:
+                    layers = fetch_records(self.conn.execute('''SELECT elevation, temperature, treecover,
+                                                             firms, map FROM Images WHERE rowid=?''',
+                                                             [cached_image['rowid']]))[0]
+                self.cache_images(region_id, layers)
+            
+            # Return cached imagery as fresh streams, leaving the cache intact
+            imagery_data = {'region': region_id, 'date': cached_image['date']}
+            imagery_data.update({layer: io.BytesIO(image) for layer, image in layers.items()})
             print("Using cached satellite imagery")
-            return cached_data
+        
+        if self.prefetch:
+            self.prefetch_maps(bounds)
+        return imagery_data
+
+    def download_maps(self, region, region_id, max_workers):
+        """
+        Download every satellite imagery layer of a region from Earth Engine.
+        
+        Args:
+            region (ee.Geometry): Region of interest
+            region_id (str): Region key (see region_key)
+            max_workers (int): Number of layers downloaded concurrently
+            
+        Returns:
+            dict: Imagery layers as BytesIO objects, with the region key and date
+        """
+        layers = list(self.layers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            imagery_data = dict(zip(layers, executor.map(self.fetch_layer, layers, [region] * len(layers))))
+        
+        # Compile imagery collection
+        imagery_data['date'] = self.date
+        imagery_data['region'] = region_id
+        return imagery_data
+
+    def prefetch_maps(self, bounds):
+        """
+        Download the imagery of the regions around a region in the background.
+        
+        The four regions of the same size sharing an edge with the given one
+        are downloaded by the prefetch workers, unless already cached or in
+        progress, so that moving to one of them does not wait for Earth Engine.
+        
+        Args:
+            bounds (tuple): Region bounds (west, south, east, north)
+        """
+        west, south, east, north = bounds
+        width, height = east - west, north - south
+        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            neighbour = (west + dx * width, south + dy * height, east + dx * width, north + dy * height)
+            region_id = region_key(neighbour)
+            with self.lock:
+                if region_id in self.image_index or region_id in self.prefetching:
+                    continue
+                self.prefetching[region_id] = self.prefetch_executor.submit(self.prefetch_region,
+                                                                            neighbour, region_id)
+
+    def prefetch_region(self, bounds, region_id):
+        """
+        Download and cache the imagery of a region from a prefetch worker.
+        
+        Layers are downloaded one after the other, leaving the bandwidth to
+        the foreground requests. A failed prefetch is only logged, the region
+        is then downloaded when it is actually loaded.
+        
+        Args:
+            bounds (tuple): Region bounds (west, south, east, north)
+            region_id (str): Region key (see region_key)
+        """
+        try:
+            region = ee.Geometry.Rectangle(list(bounds))
+            self.add_images_to_database(self.download_maps(region, region_id, 1))
+        except Exception as e:
+            logger.warning("Imagery prefetch error for region %s: %s", region_id, e)
+        finally:
+            with self.lock:
+                del self.prefetching[region_id]
+
+    def cache_images(self, region_id, layers):
+        """
+        Keep the imagery layers of a region in memory.
+        
+        Only the IMAGE_CACHE_SIZE most recently used regions are kept, the
+        least recently used one is dropped beyond that (it stays available
+        from the database). Called from the prefetch workers too, the cache
+        is only updated under the lock.
+        
+        Args:
+            region_id (str): Region key (see region_key)
+            layers (dict): Image data (bytes) by layer name
+        """
+        with self.lock:
+            self.image_cache[region_id] = layers
+            self.image_cache.move_to_end(region_id)
+            while len(self.image_cache) > IMAGE_CACHE_SIZE:
+                self.image_cache.popitem(last=False)
+
+    def fetch_layer(self, key, region):
+        """
+        Download a single satellite imagery layer from Earth Engine.
+        
+        Args:
+            key (str): Layer name ('elevation', 'temperature', 'treecover', 'firms' or 'map')
+            region (ee.Geometry): Region of interest
+            
+        Returns:
+            BytesIO: Thumbnail of the layer (PNG, JPEG for the Landsat map)
+        """
+        if key not in self.layers:
+            raise ValueError(f"Unknown imagery layer: {key}")
+        image, parameters = self.layers[key]
+        
+        url = image.getThumbURL({**parameters, 'region': region, 'dimensions': self.screen_dimensions})
+        png = io.BytesIO()
+        response = self.http.request('GET', url, preload_content=False)
+        try:
+            if response.status != 200:
+                raise urllib3.exceptions.HTTPError(f"Imagery download failed for {key}: HTTP {response.status}")
+            shutil.copyfileobj(response, png, DOWNLOAD_CHUNK)
+        finally:
+            response.release_conn()     # Return the connection to the pool
+        png.seek(0)
+        return png
 
     def add_images_to_database(self, data):
         """
@@ -449,23 +872,47 @@ class Database():
         Args:
             data (dict): Imagery data collection with binary image data
         """
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_file)
-            cur = conn.cursor()
-            cur.execute(f'''INSERT INTO Images (region, date, elevation, temperature, 
-                           treecover, firms, map)
-                           VALUES (?,?,?,?,?,?,?)''',
-                       (str(data['region']), data['date'],
-                        data['elevation'].getvalue(), data['temperature'].getvalue(),
-                        data['treecover'].getvalue(), data['firms'].getvalue(),
-                        data['map'].getvalue()))
-            conn.commit()
-            print("Satellite imagery cached successfully")
-        except sqlite3.Error as e:
-            print(f"Image caching error: {e}")
-        finally:
-            # Update local cache
-            self.init_images.append(data)
-            if conn:
-                conn.close()
\ No newline at end of file
+        with self.lock:
+            try:
+                # Layers are bound as views on their buffers, without copying the images
+                blobs = tuple(sqlite3.Binary(data[layer].getbuffer()) for layer in IMAGE_LAYERS)
+                cur = self.conn.execute(IMAGES_INSERT, (data['region'], data['date']) + blobs)
+            except sqlite3.Error as e:
+                logger.error("Image caching error: %s", e)
+                return
+            
+            # Release the views, so that the in-memory cache below shares the
+            # downloaded image buffers instead of copying them
+            del blobs
+            
+            # Update local cache once the images are stored
+            self.image_index[data['region']] = {'rowid': cur.lastrowid, 'region': data['region'],
+                                                'date': data['date']}
+        self.cache_images(data['region'], {layer: data[layer].getvalue() for layer in IMAGE_LAYERS})
+        logger.info("Satellite imagery cached successfully")
+
+    def close(self):
+        """
+        Write the pending environmental data and close the local database.
+        
+        Queued imagery prefetches are cancelled, the running ones are
+        finished first so that their images are stored.
+        """
+        if self.conn is not None:
+            self.prefetch_executor.shutdown(cancel_futures=True)
+            self.flush_data()
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        """Use the database as a context manager, closed on leaving the with block."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write the pending environmental data and close the local database."""
+        self.close()
+
+    def __del__(self):
+        """Close the local database when the interface is garbage collected."""
+        if getattr(self, 'conn', None) is not None:
+            self.close()
@@ -22,8 +22,57 @@ Features:
 """
 
 import pygame as py
+import numpy as np
 import fire_treecover, fire_wind
-import time, sys
+import time, sys, math, queue, threading
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional: without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
+    prange = range
+
+# Maximum refresh rate of the interface main loop (frames per second), the
+# simulation frames being throttled separately (see fire_sim.FRAME_RATE)
+DISPLAY_FPS = 60
+
+# Event posted by the simulation thread when a frame is ready to be drawn
+FRAME_EVENT = py.event.custom_type()
+
+# Up to this many changed cells are filled one by one on the screen, beyond
+# it redrawing the whole scaled grid is cheaper
+FILL_CELLS = 1000
+
+# Explicit signature: compiled (or loaded from the on-disk cache) on import
+@njit('void(f4[::1], f8[:, ::1], u1[:, ::1])', parallel=True, cache=True)
+def _cell_colors(fire, terrain, colors):
+    """
+    Compute the display color of map cells from their fire state.
+    
+    Args:
+        fire (ndarray): Fire intensity of the cells
+        terrain (ndarray): Terrain color of the cells, one (r, g, b) row per cell
+        colors (ndarray): Output uint8 colors, one (r, g, b) row per cell
+    """
+    for i in prange(fire.shape[0]):
+        f = fire[i]
+        if 0 < f < 1:
+            # Active fire: yellow to red gradient based on intensity
+            colors[i, 0] = 225
+            colors[i, 1] = 255 * (1 - math.sqrt(f))
+            colors[i, 2] = 0
+        elif f == 1:
+            colors[i, 0] = colors[i, 1] = colors[i, 2] = 34      # Dark gray for burned areas
+        elif f == -1:
+            colors[i, 0] = colors[i, 1] = 0                     # Blue for water/firebreaks
+            colors[i, 2] = 255
+        else:
+            for c in range(3):
+                colors[i, c] = terrain[i, c]
 
 class Screen:
     """
@@ -51,6 +100,12 @@ class Screen:
         self.map_dimensions = (100, 100)    # Grid resolution (100x100 cells)
         self.fire_origin = (51, 51)         # Default ignition point (center)
         self.mod = 1                        # Current simulation model (1=wind, 2=tree cover)
+        self.clock = py.time.Clock()        # Paces the display refresh
+        
+        # Simulation thread state
+        self.frames = queue.Queue()         # Fire intensity snapshots to draw
+        self.lock = threading.Lock()        # Guards modification_possible
+        self.simulation = None              # Running fire simulation thread
         
         # Initialize display with forest green background
         self.screen = self.window.set_mode(self.screen_dimensions)
@@ -58,7 +113,7 @@ class Screen:
         
         self.reset()
 
-    def update_map(self):
+    def update_map(self, fire=None):
         """
         Render the current map state with color-coded terrain and fire visualization.
         
@@ -69,46 +124,40 @@ class Screen:
         - Blue: Water/firebreaks
         - Green variations: Vegetation density
         - Brown: Bare ground/low vegetation
+        
+        Args:
+            fire (ndarray): Snapshot of the fire intensity grid to draw, the
+                current map state if None
         """
         # Calculate cell dimensions for grid display
         width, height = [self.screen_dimensions[i] // self.map_dimensions[i] for i in range(2)]
         
-        # Render each map cell with appropriate color
-        for x in range(self.map_dimensions[0]):
-            for y in range(self.map_dimensions[1]):
-                pos = (x * width, y * height)
-                rect = py.Rect(pos[0], pos[1], width, height)
-                parcel = self.map.map[x][y]
-                
-                # Determine cell color based on current state
-                if parcel.position == self.fire_origin:
-                    color = (255, 255, 255)  # White for ignition point
-                elif 0 < parcel.fire < 1:
-                    # Active fire: yellow to red gradient based on intensity
-                    yellow = 255 * (1 - parcel.fire ** 0.5)
-                    color = (225, yellow, 0)
-                elif parcel.fire == 1:
-                    color = (34, 34, 34)     # Dark gray for burned areas
-                elif parcel.fire == -1:
-                    color = (0, 0, 255)      # Blue for water/firebreaks
-                else:
-                    # Terrain visualization based on vegetation density
-                    if parcel.ground == 0:
-                        # No vegetation: light green grass
-                        r, g, b = 133, 255, 52
-                    elif 0.1 < parcel.ground:
-                        # Dense vegetation: darker green
-                        c = parcel.ground
-                        r, g, b = 0, 255 * c, 0
-                    else:
-                        # Sparse vegetation: brown tones
-                        c = parcel.ground
-                        r, g, b = 150 * (1 - parcel.ground), 60 * (1 - parcel.ground), 30 * (1 - parcel.ground)
-                    color = (r, g, b)
-                
-                py.draw.rect(self.screen, color, rect)
+        # Only the cells whose fire intensity changed since the last update are drawn again
+        if fire is None:
+            fire = self.map.intensity
+        changed = fire != self.last_fire
         
-        time.sleep(0.01)  # Small delay for smooth animation
+        if changed.any():
+            # Fire states, drawn over the terrain
+            cells = fire[changed]
+            colors = np.empty((len(cells), 3), dtype=np.uint8)
+            _cell_colors(cells, self.terrain[changed], colors)
+            
+            pixels = py.surfarray.pixels3d(self.grid)
+            pixels[changed] = colors
+            pixels[self.fire_origin] = (255, 255, 255)                  # White for ignition point
+            colors = pixels[changed].tolist()
+            del pixels  # Unlock the grid surface
+            self.last_fire = fire.copy()
+            
+            if len(colors) <= FILL_CELLS:
+                # Fire front only: fill the changed cells on the screen
+                for (x, y), color in zip(np.argwhere(changed).tolist(), colors):
+                    self.screen.fill(color, (x * width, y * height, width, height))
+            else:
+                # Render the whole grid at once, one pixel per cell scaled up to the cell size
+                self.screen.blit(py.transform.scale(self.grid, (self.map_dimensions[0] * width,
+                                                                self.map_dimensions[1] * height)), (0, 0))
 
     def reset(self):
         """
@@ -117,6 +166,8 @@ class Screen:
         Creates a new map using the selected simulation model and restores
         the interface to allow terrain modifications before fire ignition.
         """
+        if self.simulation_running():
+            return
         print('RESET')
         self.modification_possible = True
         
@@ -128,6 +179,19 @@ class Screen:
             # Tree coverage-based propagation model
             self.map = fire_treecover.Map(self.map_dimensions, self)
         
+        # Terrain visualization based on vegetation density, which does not
+        # change during the simulation
+        ground = self.map.ground
+        self.terrain = (1 - ground)[..., np.newaxis] * (150, 60, 30)   # Sparse vegetation: brown tones
+        dense = 0.1 < ground
+        self.terrain[dense] = 0
+        self.terrain[dense, 1] = 255 * ground[dense]                    # Dense vegetation: darker green
+        self.terrain[ground == 0] = (133, 255, 52)                      # No vegetation: light green grass
+        
+        # Display grid, one pixel per cell, entirely drawn on the next update
+        self.grid = py.Surface(self.map_dimensions, 0, 32)
+        self.last_fire = np.full(self.map_dimensions, np.nan)
+        
         # Update display and refresh screen
         self.update_map()
         self.window.flip()
@@ -136,27 +200,82 @@ class Screen:
         """
         Execute fire propagation simulation from the designated origin point.
         
-        Runs the complete fire simulation, tracking performance metrics
-        including execution time and iteration count. Disables terrain
-        modification during simulation execution.
+        Runs the fire simulation on a background thread, so the interface
+        keeps handling events while the frames it produces are drawn by the
+        main loop (see process_frames). Disables terrain modification during
+        simulation execution, and ignores the request while a fire is running.
         """
-        t = time.time()
+        with self.lock:
+            if not self.modification_possible:
+                return
+            # Lock terrain modifications during simulation
+            self.modification_possible = False
+        
         print('-' * 15)
         print('FIRE...')
+        self.simulation = threading.Thread(target=self.run_fire, args=(time.time(),), daemon=True)
+        self.simulation.start()
+
+    def run_fire(self, t):
+        """
+        Run the fire propagation simulation, on the simulation thread.
         
-        # Lock terrain modifications during simulation
-        self.modification_possible = False
+        Tracks performance metrics including execution time and iteration count.
         
-        # Execute fire propagation algorithm
+        Args:
+            t (float): Start time of the simulation request
+        """
+        # Execute fire propagation algorithm, the final state being its last frame
         iterations = self.map.fire(self.fire_origin)
         
-        # Update final display state
-        self.window.flip()
-        
         # Report simulation performance metrics
         execution_time = round(time.time() - t, 2)
         print(f"END, nombre d'iterations : {iterations} (running time : {execution_time}s)")
         print('-' * 15)
+        
+        # A new fire can be started from the origin once this one is over
+        with self.lock:
+            self.modification_possible = True
+
+    def simulation_running(self):
+        """
+        Check whether a fire simulation thread is running.
+        
+        Returns:
+            bool: True while the simulation thread is alive
+        """
+        return self.simulation is not None and self.simulation.is_alive()
+
+    def push_frame(self, fire):
+        """
+        Queue a frame of the running simulation for drawing.
+        
+        Called from the simulation thread; the main loop is woken up by a
+        FRAME_EVENT and draws the queued frames.
+        
+        Args:
+            fire (ndarray): Snapshot of the fire intensity grid
+        """
+        self.frames.put(fire)
+        py.event.post(py.event.Event(FRAME_EVENT))
+
+    def process_frames(self):
+        """
+        Draw the frames queued by the simulation thread.
+        
+        The frames are full snapshots of the fire, so only the latest one
+        queued since the last call is drawn.
+        """
+        fire = None
+        while True:
+            try:
+                fire = self.frames.get_nowait()
+            except queue.Empty:
+                break
+        
+        if fire is not None:
+            self.update_map(fire)
+            self.window.flip()
 
     def switch_mod(self, mod):
         """
@@ -170,7 +289,7 @@ class Screen:
                       1 = Wind-based propagation
                       2 = Tree coverage-based propagation
         """
-        if self.mod != mod:
+        if self.mod != mod and not self.simulation_running():
             print(f'Switch from model {self.mod} to model {mod}')
             self.mod = mod
             self.reset()  # Regenerate map with new model
@@ -190,6 +309,7 @@ if __name__ == "__main__":
     print("- Press 'ENTER' to exit")
 
     while True:
+        screen.clock.tick(DISPLAY_FPS)  # Paces the display, idle between event polls
         for event in py.event.get():
             if event.type == py.QUIT:
                 sys.exit()
@@ -204,4 +324,8 @@ if __name__ == "__main__":
                 if event.key == py.K_1:          # Switch to wind model
                     screen.switch_mod(1)
                 if event.key == py.K_2:          # Switch to tree coverage model
-                    screen.switch_mod(2)
\ No newline at end of file
+                    screen.switch_mod(2)
+            
+            # Draw the frames of a running fire simulation
+            if event.type == FRAME_EVENT:
+                screen.process_frames()
\ No newline at end of file
@@ -0,0 +1,366 @@
+"""
+Shared Fire Propagation Engine of the Theoretical Models
+
+This module implements the fire spread common to the theoretical models.
+Fire spreads over a regular grid of parcels: each parcel accumulates the fire
+of its 8 neighbours, each neighbour weighted by its own spread coefficient and
+by the weight of its direction.
+
+The models only differ by these weights:
+- Tree coverage model (fire_treecover): spread coefficient of each parcel from
+  its vegetation density, parcels with too little vegetation never catching fire
+- Wind model (fire_wind): weight of each neighbour direction from the wind
+
+Educational Purpose:
+Separates the cellular automaton shared by the models from the physical
+assumptions of each model, which fit in a few weights.
+
+@author Martin
+@created 2022
+@version 1.0.0
+"""
+
+import numpy as np
+import time
+
+try:
+    from numba import njit, prange
+    NUMBA = True
+except ImportError:
+    # Numba is optional: without it the grids are updated with NumPy
+    # operations, the kernel being far too slow as plain Python
+    NUMBA = False
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
+    prange = range
+
+# Moore neighbourhood offsets (dx, dy) of the neighbours of a parcel
+NEIGHBOUR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# Side of the square tiles the fire front is ordered by (see Map.tile_order)
+TILE_SIZE = 64
+
+# Size of the fire front below which it stays in discovery order: its
+# neighbourhoods fit in cache and sorting it would cost more than it saves
+TILE_SORT_MIN = 16384
+
+# Fire intensity above which a parcel is actively burning (below 1), in single
+# precision like the grids so the kernel and NumPy operations agree
+FIRE_THRESHOLD = np.float32(10**-4)
+
+# Maximum refresh rate of the simulation display (frames per second), the
+# fire keeps spreading between two frames
+FRAME_RATE = 30
+
+def _neighbour_values(values):
+    """
+    Iterate over the values of the Moore neighbours of every parcel.
+    
+    Each neighbour direction gives one grid holding, for every parcel, the
+    value of its neighbour in that direction (0 outside the map).
+    
+    Args:
+        values (ndarray): Parcel values on the map grid
+    
+    Yields:
+        tuple: Neighbour offset (dx, dy) and the neighbour values grid
+    """
+    width, height = values.shape
+    padded = np.pad(values, 1)
+    for dx, dy in NEIGHBOUR_OFFSETS:
+        yield (dx, dy), padded[1 + dx:1 + dx + width, 1 + dy:1 + dy + height]
+
+def _neighbour_positions(x, y, dimensions):
+    """
+    Iterate over the Moore neighbours of a set of parcels.
+    
+    Args:
+        x, y (ndarray): Grid coordinates of the parcels
+        dimensions (tuple): Map dimensions (width, height)
+    
+    Yields:
+        tuple: Neighbour coordinates (i, j), clamped to the map, and whether
+            each neighbour lies on the map, one tuple per neighbour direction
+    """
+    width, height = dimensions
+    for dx, dy in NEIGHBOUR_OFFSETS:
+        i, j = x + dx, y + dy
+        inside = (0 <= i) & (i < width) & (0 <= j) & (j < height)
+        yield np.clip(i, 0, width - 1), np.clip(j, 0, height - 1), inside
+
+# Explicit signatures: the kernel is compiled (or loaded from the on-disk
+# cache) when the module is imported, not on the first fire. It releases the
+# GIL, the interface thread drawing frames while the simulation thread runs it
+@njit('i8(f4[:, ::1], f4[:, ::1], f4[::1], b1[:, ::1], f4[:, ::1], i4[::1], f4[::1], b1[:, ::1], i4[::1])',
+      parallel=True, cache=True, nogil=True)
+def _spread_kernel(intensity, k_s, weights, spreadable, neighbour_count, active, new_values, front, queued):
+    """
+    Advance the fire of the active parcels by one iteration.
+    
+    Same update as Map.fire_calcul and the fire front selection of
+    Map.spread_step, only visiting the active parcels and their neighbours.
+    
+    Args:
+        intensity (ndarray): Fire intensity of the parcels, updated in place
+        k_s (ndarray): Fire spread coefficient of the parcels
+        weights (ndarray): Fire contribution weight of each neighbour direction
+        spreadable (ndarray): Boolean grid of the parcels able to catch fire
+        neighbour_count (ndarray): Number of neighbours of the parcels
+        active (ndarray): Flat indices of the parcels to update
+        new_values (ndarray): Buffer for the new fire intensity of the active parcels
+        front (ndarray): Boolean grid of the parcels already queued, clear
+            on entry and on return
+        queued (ndarray): Output flat indices of the parcels active on the next iteration
+    
+    Returns:
+        int: Number of parcels written to queued
+    """
+    width, height = intensity.shape
+    
+    # Weighted average of the neighbour fire intensities of the previous iteration
+    for n in prange(len(active)):
+        x, y = active[n] // height, active[n] % height
+        influence = 0.0
+        for direction, (dx, dy) in enumerate(NEIGHBOUR_OFFSETS):
+            i, j = x + dx, y + dy
+            if 0 <= i < width and 0 <= j < height:
+                influence += intensity[i, j] * k_s[i, j] * weights[direction]
+        new_values[n] = min(intensity[x, y] + influence / neighbour_count[x, y], 1.0)
+    
+    # Actively burning parcels stay active, and their unburned neighbours able
+    # to catch fire join them. Neighbouring parcels queue the same parcels, so
+    # this pass is sequential.
+    count = 0
+    for n in range(len(active)):
+        if not FIRE_THRESHOLD < new_values[n] < 1:
+            continue
+        x, y = active[n] // height, active[n] % height
+        if not front[x, y]:
+            front[x, y] = True
+            queued[count] = active[n]
+            count += 1
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            i, j = x + dx, y + dy
+            if (0 <= i < width and 0 <= j < height and not front[i, j] and
+                    0 <= intensity[i, j] < 1 and spreadable[i, j]):
+                front[i, j] = True
+                queued[count] = i * height + j
+                count += 1
+    
+    # Apply all calculated fire intensity updates simultaneously
+    for n in prange(len(active)):
+        intensity[active[n] // height, active[n] % height] = new_values[n]
+    for n in range(count):
+        front[queued[n] // height, queued[n] % height] = False
+    return count
+
+class Map:
+    """
+    Regular grid of terrain parcels for the fire propagation simulation.
+    
+    Holds the parcel grids and runs the fire spread, the models setting the
+    fire spread coefficients (k_s), the direction weights (weights) and the
+    parcels able to catch fire (spreadable) in generate_map.
+    
+    Parcel properties are stored as 2D NumPy arrays indexed by the grid
+    coordinates (x, y), one array per property.
+    """
+    
+    iterations = 0  # Default iteration limit of the model (0 = run until completion)
+
+    def __init__(self, map_dimensions, parent):
+        """
+        Initialize the terrain map with specified dimensions.
+        
+        Args:
+            map_dimensions (tuple): Grid size (width, height) in cells
+            parent: Display interface, receiving snapshots of the fire
+                intensity grid through push_frame
+        """
+        self.parent = parent  # Reference to visualization system
+        self.generate_map(map_dimensions)
+
+    def generate_map(self, dimensions):
+        """
+        Allocate the parcel grids and the buffers of the fire spread.
+        
+        The parcels start bare and uniform: unit spread coefficients and
+        direction weights, every parcel able to catch fire. The models call
+        this method first, then set their own terrain.
+        
+        Args:
+            dimensions (tuple): Map dimensions (width, height) in parcels
+        """
+        # Single precision parcel grids, ample for the 1e-4 fire threshold
+        # and half the memory traffic of float64 (float16 would lose the
+        # small increments of the fire intensity near 1)
+        self.ground = np.zeros(dimensions, dtype=np.float32)        # Vegetation density, normalized for display
+        self.k_s = np.ones(dimensions, dtype=np.float32)            # Fire spread coefficient
+        self.spreadable = np.ones(dimensions, dtype=bool)           # Parcels able to catch fire
+        self.intensity = np.zeros(dimensions, dtype=np.float32)     # Fire intensity: 0=none, 0-1=burning, 1=burned
+        
+        # Fire contribution weight of each neighbour direction, in the order
+        # of NEIGHBOUR_OFFSETS
+        self.weights = np.ones(len(NEIGHBOUR_OFFSETS), dtype=np.float32)
+        
+        # Number of parcels in the 8-directional neighbourhood (Moore
+        # neighborhood) of each parcel, fewer on the map borders
+        self.neighbour_count = sum(count for _, count in _neighbour_values(np.ones(dimensions, dtype=np.float32)))
+        
+        # Parcels already queued for the next iteration (see _spread_kernel)
+        self.front = np.zeros(dimensions, dtype=bool)
+        
+        # Tile-major order of the fire front: parcels of a TILE_SIZE x TILE_SIZE
+        # tile are processed together so their neighbourhoods stay in cache.
+        # tile_order[r] is the flat index of the r-th parcel, tile_rank its inverse
+        x, y = np.divmod(np.arange(self.intensity.size), dimensions[1])
+        tile = (x // TILE_SIZE) * -(-dimensions[1] // TILE_SIZE) + y // TILE_SIZE
+        self.tile_order = np.lexsort((np.arange(self.intensity.size), tile)).astype(np.int32)
+        self.tile_rank = np.empty(self.intensity.size, dtype=np.int32)
+        self.tile_rank[self.tile_order] = np.arange(self.intensity.size, dtype=np.int32)
+        
+        # Kernel buffers, allocated once: the new fire intensities of the
+        # active parcels, and two fire front buffers used in turn, one read
+        # while the next fire front is written to the other
+        self.new_values = np.empty(self.intensity.size, dtype=np.float32)
+        self.queue_a = np.empty(self.intensity.size, dtype=np.int32)
+        self.queue_b = np.empty(self.intensity.size, dtype=np.int32)
+
+    def fire_calcul(self, active):
+        """
+        Calculate next fire intensity of the active parcels based on neighboring fire states.
+        
+        Uses weighted average of neighbor fire intensities, each neighbor
+        weighted by its spread coefficient (k_s) and its direction weight.
+        
+        Args:
+            active (ndarray): Flat indices of the parcels to update
+        
+        Returns:
+            ndarray: New fire intensity of the parcels (capped at 1.0 for fully burned)
+        """
+        x, y = np.divmod(active, self.intensity.shape[1])
+        
+        # Sum the weighted fire contributions from all neighbors
+        neighbor_fire_influence = 0
+        for weight, (i, j, inside) in zip(self.weights, _neighbour_positions(x, y, self.intensity.shape)):
+            neighbor_fire_influence += np.where(inside, self.intensity[i, j] * self.k_s[i, j], 0) * weight
+        
+        # Average the influence across all neighbors
+        average_influence = neighbor_fire_influence / self.neighbour_count[x, y]
+        
+        # Update fire intensity (cumulative effect), capped at maximum burn level
+        return np.minimum(self.intensity[x, y] + average_influence, 1)
+
+    def spread_step(self, active, queued):
+        """
+        Update the fire intensity of the active parcels for one iteration.
+        
+        Actively burning parcels stay active, and their unburned neighbours
+        able to catch fire join them. Only the fire front is visited, parcels
+        burned out or out of reach of the fire cost nothing.
+        
+        Args:
+            active (ndarray): Flat indices of the parcels burning or at risk
+            queued (ndarray): Buffer for the next fire front, not overlapping active
+                (only used by the Numba kernel)
+        
+        Returns:
+            ndarray: Flat indices of the parcels active on the next iteration, in tile order
+                (large fronts only with the Numba kernel, see TILE_SORT_MIN)
+        """
+        if NUMBA:
+            new_fire = self.new_values[:len(active)]
+            count = _spread_kernel(self.intensity, self.k_s, self.weights, self.spreadable,
+                                   self.neighbour_count, active, new_fire, self.front, queued)
+            if count < TILE_SORT_MIN:
+                return queued[:count]
+            ranks = self.tile_rank[queued[:count]]
+            ranks.sort()
+            return np.take(self.tile_order, ranks, out=queued[:count])
+        
+        # Calculate new fire intensities for all active parcels
+        new_fire = self.fire_calcul(active)
+        
+        # Actively burning parcels stay active and spread to their neighbours
+        burning = active[(FIRE_THRESHOLD < new_fire) & (new_fire < 1)]
+        x, y = np.divmod(burning, self.intensity.shape[1])
+        queued = [burning]
+        for i, j, inside in _neighbour_positions(x, y, self.intensity.shape):
+            # Add unburned neighbors able to catch fire to the next iteration
+            spreading = inside & (0 <= self.intensity[i, j]) & (self.intensity[i, j] < 1)
+            spreading &= self.spreadable[i, j]
+            queued.append(i[spreading] * self.intensity.shape[1] + j[spreading])
+        
+        # Apply all calculated fire intensity updates simultaneously
+        self.intensity.flat[active] = new_fire
+        return self.tile_order[np.unique(self.tile_rank[np.concatenate(queued)])]
+
+    def fire(self, position, iterations=None, render=True):
+        """
+        Execute fire propagation simulation from specified ignition point.
+        
+        Implements iterative fire spread over a set of active parcels, where
+        fire intensity is calculated for each parcel based on its neighbors,
+        and new parcels are added to the active fire front when they ignite.
+        
+        Args:
+            position (tuple): Ignition coordinates (x, y)
+            iterations (int): Maximum iterations (0 = run until completion),
+                the model default (Map.iterations) if None
+            render (bool): Send the fire progress to the parent display,
+                the final state being sent in any case
+        
+        Returns:
+            int: Total number of simulation iterations executed
+        """
+        def spread_iteration(active, max_iterations):
+            """
+            Execute one complete fire spread iteration across all active parcels.
+            
+            Args:
+                active (ndarray): Flat indices of the parcels burning or at risk
+                max_iterations (int): Iteration limit (0 = unlimited)
+            
+            Returns:
+                int: Number of iterations completed
+            """
+            iteration_count = 0
+            queues = (self.queue_a, self.queue_b)   # active is read from queue_a on the first iteration
+            last_frame = time.perf_counter()
+            
+            # Continue until fire stops spreading or iteration limit reached
+            while active.size and (max_iterations <= 0 or iteration_count < max_iterations):
+                
+                # Update the fire intensities and fire front of all active parcels
+                active = self.spread_step(active, queues[(iteration_count + 1) % 2])
+                iteration_count += 1
+                
+                # Send a frame to the display, at most FRAME_RATE times per second
+                if render and time.perf_counter() - last_frame >= 1 / FRAME_RATE:
+                    self.parent.push_frame(self.intensity.copy())
+                    last_frame = time.perf_counter()
+            
+            # Display the final state of the fire
+            self.parent.push_frame(self.intensity.copy())
+            
+            return iteration_count
+        
+        if iterations is None:
+            iterations = self.iterations
+        
+        # Initialize fire at specified origin point
+        x, y = position
+        self.intensity[x, y] = 0.1  # Set initial fire intensity
+        
+        # Start with neighbors of ignition point as initial fire front
+        width, height = self.intensity.shape
+        neighbours = [(x + dx) * height + y + dy for dx, dy in NEIGHBOUR_OFFSETS
+                      if 0 <= x + dx < width and 0 <= y + dy < height]
+        initial_queue = self.queue_a[:len(neighbours)]
+        initial_queue[:] = self.tile_order[np.sort(self.tile_rank[neighbours])]
+        
+        # Execute fire propagation simulation
+        return spread_iteration(initial_queue, iterations)
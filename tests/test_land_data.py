@@ -0,0 +1,83 @@
+"""
+Tests of the local imagery cache of the Earth Engine data interface.
+
+The Database instances are built around an in-memory SQLite connection,
+without connecting to Earth Engine.
+"""
+
+import os, sys, sqlite3, threading, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Earth_Engine_model'))
+
+try:
+    import land_data
+except ImportError:
+    # Earth Engine model dependencies (earthengine-api, python-dateutil) not installed
+    land_data = None
+
+# Closed (longitude, latitude) polygon of a region, as keyed by earlier versions
+POLYGON = [(6.580468, 43.404227), (6.251565, 43.404227), (6.251565, 43.185331),
+           (6.580468, 43.185331), (6.580468, 43.404227)]
+BOUNDS = (6.251565, 43.185331, 6.580468, 43.404227)
+DATE = '2021-08-16 17:00:00'
+
+
+@unittest.skipIf(land_data is None, "requires the Earth Engine model dependencies")
+class MigrateRegionKeysTest(unittest.TestCase):
+
+    def setUp(self):
+        # Database bound to an in-memory Images table, like the one of image_database
+        self.database = land_data.Database.__new__(land_data.Database)
+        self.database.conn = sqlite3.connect(':memory:', isolation_level=None)
+        self.database.lock = threading.Lock()
+        self.database.conn.execute('''CREATE TABLE Images
+        (region VARCHAR, date DATE, map VARBINARY, elevation VARBINARY,
+         temperature VARBINARY, treecover VARBINARY, firms VARBINARY,
+         PRIMARY KEY (region, date));''')
+
+    def tearDown(self):
+        self.database.conn.close()
+        self.database.conn = None   # Nothing left for Database.close
+
+    def insert(self, region, date, image):
+        self.database.conn.execute('''INSERT INTO Images (region, date, map) VALUES (?,?,?)''',
+                                   (region, date, image))
+
+    def rows(self):
+        return sorted(self.database.conn.execute('''SELECT region, date, map FROM Images'''))
+
+    def test_legacy_key(self):
+        self.insert(str(POLYGON), DATE, b'legacy')
+        self.database.migrate_region_keys()
+        self.assertEqual(self.rows(), [(land_data.region_key(BOUNDS), DATE, b'legacy')])
+
+    def test_collision_keeps_hashed_row(self):
+        # The region was downloaded again under its hashed key
+        self.insert(str(POLYGON), DATE, b'legacy')
+        self.insert(land_data.region_key(BOUNDS), DATE, b'hashed')
+        self.insert(str(POLYGON), '2021-08-17 17:00:00', b'other date')
+        self.database.migrate_region_keys()
+        self.assertEqual(self.rows(), [(land_data.region_key(BOUNDS), DATE, b'hashed'),
+                                       (land_data.region_key(BOUNDS), '2021-08-17 17:00:00', b'other date')])
+
+    def test_collision_between_legacy_keys(self):
+        # Same region written with differently formatted coordinates
+        self.insert(str(POLYGON), DATE, b'first')
+        self.insert(str([(f'{x:.8f}', f'{y:.8f}') for x, y in POLYGON]).replace("'", ''), DATE, b'second')
+        self.database.migrate_region_keys()
+        rows = self.rows()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][:2], (land_data.region_key(BOUNDS), DATE))
+
+    def test_failure_leaves_table_unchanged(self):
+        self.insert(str(POLYGON), DATE, b'legacy')
+        self.insert('[not a polygon', DATE, b'malformed')
+        before = self.rows()
+        with self.assertLogs(land_data.logger, 'ERROR'):
+            self.database.migrate_region_keys()
+        self.assertEqual(self.rows(), before)
+        self.assertFalse(self.database.conn.in_transaction)
+
+
+if __name__ == '__main__':
+    unittest.main()